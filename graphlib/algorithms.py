@@ -86,6 +86,21 @@ class ShortestPathSearchResult:
     """
     path: Tuple[Edge, ...]
 
+    def __post_init__(self):
+        # the hash is calculated just once, so that comparison of two results
+        # with distinct paths can be decided without walking the paths; it is
+        # not declared as a field, so it does not leak into fields(), asdict()
+        # or astuple()
+        object.__setattr__(self, '_hash', hash(self.path))
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, ShortestPathSearchResult):
+            return NotImplemented
+        return self._hash == other._hash and self.path == other.path
+
+    def __hash__(self) -> int:
+        return self._hash
+
     @property
     def start(self) -> str:
         """The start edge of the found shortest path.
@@ -145,15 +160,21 @@ class MinimumSpanningTreeSearchResult:
     search_start: Optional[str]
     edges: Tuple[Edge, ...]
 
+    def __post_init__(self):
+        # the edges are immutable, so the overall weight can be calculated
+        # just once instead of upon each access; it is not declared as a
+        # field, so it does not leak into fields(), asdict() or astuple()
+        object.__setattr__(self, '_overall_weight', sum(edge.weight for edge in self.edges))
+
     @property
-    def overall_weight(self):
+    def overall_weight(self) -> int:
         """The overall weight of the minimum spanning represeted by this
         object.
 
         In other words, the sum of the weights of all edges comprising the
         minimum spanning tree.
         """
-        return sum(map(lambda edge: edge.weight, self.edges))
+        return self._overall_weight
 
     def __contains__(self, edge: Edge) -> bool:
         """Verifies whether the given edge is part of the minimum spanning tree
@@ -314,20 +335,18 @@ class _DistanceTable:
             message = f'There is no path from {self._starting_vertex} to {destination}.'
             raise ValueError(message)
 
-        path = deque()
-        predecessor: str = self._entries[destination].predecessor
-        destination_distance = self._entries[destination].distance_from_start
-        predecessor_distance = self._entries[predecessor].distance_from_start
-        weight = destination_distance - predecessor_distance
+        # iterative walk from the destination to the start, each step involves
+        # a single lookup of the predecessor's entry
+        entries = self._entries
+        path: deque = deque()
+        entry = entries[destination]
         while True:
-            path.appendleft(Edge(predecessor, destination, weight))
-            destination = predecessor
-            predecessor = self._entries[destination].predecessor
-            if predecessor == destination == self._starting_vertex:
+            predecessor_entry = entries[entry.predecessor]
+            weight = entry.distance_from_start - predecessor_entry.distance_from_start
+            path.appendleft(Edge(predecessor_entry.vertex, entry.vertex, weight))
+            if predecessor_entry.vertex == self._starting_vertex:
                 break
-            destination_distance = self._entries[destination].distance_from_start
-            predecessor_distance = self._entries[predecessor].distance_from_start
-            weight = destination_distance - predecessor_distance
+            entry = predecessor_entry
         return ShortestPathSearchResult(tuple(path))
 
     def __contains__(self, vertex: str) -> bool:
@@ -23,6 +23,49 @@ like a graph or a result of shortest path search.
 from graphlib.algorithms import MinimumSpanningTreeSearchResult, ShortestPathSearchResult
 from graphlib.graph import AbstractGraph
 
+def dump_graph_to_str(graph: AbstractGraph) -> str:
+    """Creates and returns a dump of the vertices and edges of the given graph.
+
+    The dump is generated in a structured way, and it also includes the weights
+    of the edges.
+
+    Args:
+        graph (AbstractGraph): The graph to be dumped.
+
+    Returns:
+        str: The created dump.
+    """
+    is_weighted = graph.is_weighted
+    weighted = 'YES' if is_weighted else 'NO'
+    vertices = graph.get_all_vertices(sort=True)
+    parts = [
+        '\n',
+        f'Graph type: {graph.graph_type}\n',
+        f'Weighted: {weighted}\n',
+        f'Vertices (totally {graph.vertex_count}):\n',
+    ]
+    for current_vertex in vertices:
+        parts.append(f' - {current_vertex}\n')
+    parts.append('Edges:\n')
+    vertex_pairs = [
+        (current_vertex, adjacent_vertex)
+        for current_vertex in vertices
+        for adjacent_vertex in graph.get_adjacent_vertices(current_vertex)
+    ]
+    if is_weighted:
+        parts.extend(
+            f' - {start} -> {destination} (weight = {graph.get_edge_weight(start, destination)})\n'
+            for start, destination in vertex_pairs
+        )
+    elif vertex_pairs:
+        # all edges of an unweighted graph have the same weight, so it is
+        # enough to look it up (and format it) just once
+        weight = graph.get_edge_weight(*vertex_pairs[0])
+        suffix = f' (weight = {weight})\n'
+        parts.extend(f' - {start} -> {destination}{suffix}' for start, destination in vertex_pairs)
+    return ''.join(parts)
+
+
 def dump_graph(graph: AbstractGraph, output):
     """Dumps the vertices and edges of the given graph to given text output.
 
@@ -35,18 +78,31 @@ def dump_graph(graph: AbstractGraph, output):
                                It can be a file, sys.stdout, or an io.StringIO
                                instance.
     """
-    weighted = 'YES' if graph.is_weighted else 'NO'
-    output.write('\n')
-    output.write(f'Graph type: {graph.graph_type}\n')
-    output.write(f'Weighted: {weighted}\n')
-    output.write(f'Vertices (totally {graph.vertex_count}):\n')
-    for current_vertex in graph.get_all_vertices(sort=True):
-        output.write(f' - {current_vertex}\n')
-    output.write('Edges:\n')
-    for current_vertex in graph.get_all_vertices(sort=True):
-        for adjacent_vertex in graph.get_adjacent_vertices(current_vertex):
-            weight = graph.get_edge_weight(current_vertex, adjacent_vertex)
-            output.write(f' - {current_vertex} -> {adjacent_vertex} (weight = {weight})\n')
+    output.write(dump_graph_to_str(graph))
+
+
+def dump_shortest_path_to_str(shortest_path: ShortestPathSearchResult) -> str:
+    """Creates and returns a dump of the given shortest path.
+
+    The dump provides information about the start and the destination of the
+    path, the overall distance, and about the individual edges comprising the
+    path.
+
+    Args:
+        shortest_path (ShortestPathSearchResult): The shortest path to be dumped.
+
+    Returns:
+        str: The created dump.
+    """
+    parts = [
+        '\n',
+        f'Shortest path from {shortest_path.start} to {shortest_path.destination}\n',
+        f'Overall distance {shortest_path.overall_distance}\n',
+        'Path:\n',
+    ]
+    for edge in shortest_path.path:
+        parts.append(f' - {edge.start} -> {edge.destination} (weight = {edge.weight})\n')
+    return ''.join(parts)
 
 
 def dump_shortest_path(shortest_path: ShortestPathSearchResult, output):
@@ -63,12 +119,7 @@ def dump_shortest_path(shortest_path: ShortestPathSearchResult, output):
                                                   sys.stdout, or an io.StringIO
                                                   instance.
     """
-    output.write('\n')
-    output.write(f'Shortest path from {shortest_path.start} to {shortest_path.destination}\n')
-    output.write(f'Overall distance {shortest_path.overall_distance}\n')
-    output.write('Path:\n')
-    for edge in shortest_path.path:
-        output.write(f' - {edge.start} -> {edge.destination} (weight = {edge.weight})\n')
+    output.write(dump_shortest_path_to_str(shortest_path))
 
 
 def dump_minimum_spanning_tree(minimum_spanning_tree: MinimumSpanningTreeSearchResult, output):
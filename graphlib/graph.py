@@ -24,9 +24,8 @@ supporting the above mentioned two graph implementations.
 """
 
 from abc import ABC, abstractmethod, abstractproperty
-from dataclasses import dataclass
 from enum import Enum, unique
-from typing import Dict, List, Set, Tuple
+from typing import Dict, Iterable, List, NamedTuple, Optional, Set, Tuple
 
 
 def _create_matrix(size: int, default_value: int = 0) -> List[List[int]]:
@@ -43,13 +42,16 @@ class GraphType(Enum):
     UNDIRECTED = 2
 
 
-@dataclass(frozen=True)
-class Edge:
+class Edge(NamedTuple):
     """Immutable structure representing a single edge of a graph.
+
+    Edges are frequently used as members of sets and as dictionary keys, so
+    they are implemented as named tuples, which are compact and provide fast
+    hashing and comparison.
     """
     start: str
     destination: str
-    weight: int
+    weight: int = 1
 
 
 class _VertexRegistry:
@@ -57,9 +59,17 @@ class _VertexRegistry:
     representations.
     """
 
-    def __init__(self):
+    def __init__(self, capacity: Optional[int] = None):
         """Constructs a new empty vertex registry instance.
+
+        Args:
+            capacity (Optional[int], optional): The maximal number of vertices
+                                                the constructed registry is
+                                                allowed to contain; None
+                                                (default) if the number of
+                                                vertices is not limited.
         """
+        self._capacity = capacity
         self._sequence: int = 0
         self._name_to_id_mapping = {}
         self._id_to_name_mapping = {}
@@ -92,6 +102,39 @@ class _VertexRegistry:
             raise ValueError(message)
         return self._name_to_id_mapping[name]
 
+    def get_or_generate_ids(self, name_one: str, name_two: str) -> Tuple[int, int]:
+        """Returns the unique IDs of the given pair of vertices. New IDs are
+        generated for the vertices not contained in this registry yet.
+
+        Args:
+            name_one (str): The name of the first vertex.
+            name_two (str): The name of the second vertex.
+
+        Raises:
+            ValueError: If the generation of the new IDs would make this
+                        registry exceed its capacity. In such case, no new ID
+                        is generated at all.
+
+        Returns:
+            Tuple[int, int]: The unique IDs of the given pair of vertices.
+        """
+        name_to_id_mapping = self._name_to_id_mapping
+        # both vertices are known for all but the first few edges involving
+        # them, so that case costs just two dictionary lookups, and the
+        # capacity is only checked when new IDs are to be generated
+        try:
+            return name_to_id_mapping[name_one], name_to_id_mapping[name_two]
+        except KeyError:
+            pass
+        new_names = [name for name in dict.fromkeys((name_one, name_two))
+                     if name not in name_to_id_mapping]
+        if self._capacity is not None and len(name_to_id_mapping) + len(new_names) > self._capacity:
+            message = f'Cannot add more than {self._capacity} vertices.'
+            raise ValueError(message)
+        for name in new_names:
+            self.get_id(name, True)
+        return name_to_id_mapping[name_one], name_to_id_mapping[name_two]
+
     def get_name(self, vertex_id: int) -> str:
         """Returns the name of the vertex with the given vertex ID.
 
@@ -152,6 +195,25 @@ class AbstractGraph(ABC):
 
     def __init__(self, graph_type: GraphType):
         self._graph_type = graph_type
+        # names of all vertices in ascending order; they are only sorted when
+        # requested, and the sorted tuple is cached until a vertex is added
+        self._sorted_vertices: Tuple[str, ...] = ()
+
+    def _get_sorted_vertices(self) -> Tuple[str, ...]:
+        """Internal helper method returning the names of all vertices sorted
+        in ascending order. The sorted tuple is cached, so the vertices are
+        only sorted again after a new vertex has been added.
+
+        Vertices are never removed from a graph, so the cached tuple is up to
+        date as long as its length matches the number of vertices, and adding
+        an edge does not have to invalidate it.
+
+        Returns:
+            Tuple[str, ...]: Tuple containing the sorted names of all vertices.
+        """
+        if len(self._sorted_vertices) != self.vertex_count:
+            self._sorted_vertices = tuple(sorted(self.get_all_vertices()))
+        return self._sorted_vertices
 
     @property
     def graph_type(self) -> GraphType:
@@ -309,6 +371,35 @@ class AbstractGraph(ABC):
         """
         raise NotImplementedError
 
+    def add_edges(self, edges: Iterable[Tuple]):
+        """Adds all given edges to this graph. Each edge is to be specified as
+        a tuple (vertex one, vertex two) or a tuple (vertex one, vertex two,
+        weight), with the same semantics as the arguments of the add_edge
+        method. Edges without explicit weight get the default weight of the
+        add_edge method.
+
+        The edges are validated and added one by one, so that the given
+        iterable can be consumed lazily. If any of the given tuples turns out
+        to be invalid, the edges preceding it remain added to this graph.
+
+        This is a fully functional implementation of this method which is not
+        supposed to be overridden by subclasses of this class.
+
+        Args:
+            edges (Iterable[Tuple]): The edges to be added to this graph.
+
+        Raises:
+            ValueError: If any of the given tuples does not consist of two or
+                        three elements. The edges preceding the invalid tuple
+                        have already been added when this exception is raised.
+        """
+        add_edge = self.add_edge
+        for edge in edges:
+            if not 2 <= len(edge) <= 3:
+                message = f'Invalid edge {edge}, expected (vertex one, vertex two[, weight]).'
+                raise ValueError(message)
+            add_edge(*edge)
+
     @abstractmethod
     def get_edge_weight(self, vertex_one: str, vertex_two: str) -> int:
         """Returns the weight of the edge connecting the given pair of
@@ -369,7 +460,7 @@ class AdjacencyMatrixGraph(AbstractGraph):
         """
         super().__init__(graph_type)
         self._matrix = _create_matrix(vertex_count)
-        self._registry = _VertexRegistry()
+        self._registry = _VertexRegistry(vertex_count)
         self._weights: Set[int] = set()
 
     @property
@@ -408,9 +499,14 @@ class AdjacencyMatrixGraph(AbstractGraph):
                           undirected, the wieght is applied to both
                           directions. This argument is optional - the
                           value 1 is used as default.
+
+        Raises:
+            ValueError: If the vertices not yet involved in this graph do not
+                        fit into the adjacency matrix of this graph. The graph
+                        is left unchanged in such case.
         """
-        vertex_one_index = self._registry.get_id(vertex_one, True)
-        vertex_two_index = self._registry.get_id(vertex_two, True)
+        registry = self._registry
+        vertex_one_index, vertex_two_index = registry.get_or_generate_ids(vertex_one, vertex_two)
         self._matrix[vertex_one_index][vertex_two_index] = weight
         if self.graph_type is GraphType.UNDIRECTED:
             self._matrix[vertex_two_index][vertex_one_index] = weight
@@ -426,7 +522,7 @@ class AdjacencyMatrixGraph(AbstractGraph):
                              If requested, the names are sorted in ascending
                              alphabetical order.
         """
-        return tuple(sorted(self._registry.get_names()) if sort else self._registry.get_names())
+        return self._get_sorted_vertices() if sort else self._registry.get_names()
 
     def get_adjacent_vertices(self, vertex: str) -> Tuple[str, ...]:
         """Creates and returns a new tuple containing the names of vertices
@@ -624,11 +720,15 @@ class AdjacencySetGraph(AbstractGraph):
         self._weights.add(weight)
 
     def _add_edge(self, vertex_one: str, vertex_two: str, weight: int):
-        if not vertex_one in self._adjacency_sets:
-            self._adjacency_sets[vertex_one] = _AdjacencySet(vertex_one)
-        if not vertex_two in self._adjacency_sets:
+        # single lookup per vertex - the adjacency set of the start vertex is
+        # kept in a local variable instead of being looked up again
+        adjacency_set = self._adjacency_sets.get(vertex_one)
+        if adjacency_set is None:
+            adjacency_set = _AdjacencySet(vertex_one)
+            self._adjacency_sets[vertex_one] = adjacency_set
+        if vertex_two not in self._adjacency_sets:
             self._adjacency_sets[vertex_two] = _AdjacencySet(vertex_two)
-        self._adjacency_sets[vertex_one].add_edge(vertex_two, weight)
+        adjacency_set.add_edge(vertex_two, weight)
 
     def get_all_vertices(self, sort: bool = False) -> Tuple[str, ...]:
         """Creates and returns a new tuple containing names of all
@@ -640,7 +740,7 @@ class AdjacencySetGraph(AbstractGraph):
                              If requested, the names are sorted in ascending
                              alphabetical order.
         """
-        return tuple(sorted(self._adjacency_sets) if sort else self._adjacency_sets)
+        return self._get_sorted_vertices() if sort else tuple(self._adjacency_sets)
 
     def get_adjacent_vertices(self, vertex: str) -> Tuple[str, ...]:
         """Creates and returns a new tuple containing the names of vertices
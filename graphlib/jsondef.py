@@ -18,44 +18,100 @@
 #
 
 """This module allows to read graph definitions from JSON files.
+
+The weight of an edge is optional (1 is used if it is omitted). If present, it
+has to be a positive integer, which can be specified as a JSON number without
+fractional part, or as a string accepted by the int() constructor (e.g. "7",
+"+7" or "1_000"). Booleans and numbers with fractional part are rejected.
 """
 
-from json import loads
-from typing import Any, Dict, Sequence, Tuple
+import re
+from hashlib import blake2b
+from sys import intern
+from typing import IO, Any, AnyStr, Dict, Sequence, Tuple, Union
 
 from graphlib.graph import AdjacencyMatrixGraph, AdjacencySetGraph, GraphType
 
+# orjson is an optional dependency - if it is installed, it is used to parse
+# the JSON definitions as it is considerably faster than the json module from
+# the Python Standard Library (both accept str and raise a ValueError subclass
+# for malformed JSON)
+try:
+    from orjson import loads
+except ImportError:
+    from json import loads
+
+
+# mapping of the graph type names permitted in JSON definitions to the graph
+# types, built just once when the module is loaded
+_GRAPH_TYPES: Dict[str, GraphType] = {graph_type.name: graph_type for graph_type in GraphType}
+
+# string representation of a weight accepted by the int() constructor (optional
+# plus sign, digits optionally grouped by underscores, surrounding whitespace)
+_WEIGHT_STRING_RE = re.compile(r'\s*\+?\d+(?:_\d+)*\s*')
+
+# single edge read from a JSON definition (start vertex, destination vertex, weight)
+_EdgeDefinition = Tuple[str, str, int]
+
+# graph definition read from a JSON definition (graph type, edges)
+_GraphDefinition = Tuple[GraphType, Sequence[_EdgeDefinition]]
+
+# the maximal number of parsed JSON strings kept by _parse_graph_definition_string
+_PARSED_DEFINITION_CACHE_SIZE = 64
+
+# parsed JSON strings keyed by the digest of their content, in insertion order
+_PARSED_DEFINITION_CACHE: Dict[bytes, _GraphDefinition] = {}
+
 
 def _read_graph_type(json_data: Dict[str, Any]) -> GraphType:
     if 'graphType' not in json_data:
         raise ValueError('Undefined graph type.')
     graph_type_as_string = json_data['graphType']
-    try:
-        return GraphType[graph_type_as_string]
-    except KeyError:
+    graph_type = _GRAPH_TYPES.get(graph_type_as_string)
+    if graph_type is None:
         raise ValueError(f'Invalid graph type: {graph_type_as_string}.')
+    return graph_type
+
 
+def _parse_weight(raw_weight: Any) -> int:
+    # weights are expected to be JSON integers, so that case is checked first;
+    # the other accepted representations are checked explicitly instead of
+    # relying on int() raising an exception; booleans (a subclass of int) as
+    # well as non-integral floats are rejected rather than truncated to int
+    if isinstance(raw_weight, bool):
+        weight = 0
+    elif isinstance(raw_weight, int):
+        weight = raw_weight
+    elif isinstance(raw_weight, str) and _WEIGHT_STRING_RE.fullmatch(raw_weight):
+        weight = int(raw_weight)
+    elif isinstance(raw_weight, float) and raw_weight.is_integer():
+        weight = int(raw_weight)
+    else:
+        weight = 0
+    if weight <= 0:
+        raise ValueError(f'Invalid weight: {raw_weight}.')
+    return weight
+
+
+def _read_vertex(vertex: Any) -> Any:
+    # the same vertex names occur in many edges, and the graph implementations
+    # use them as dictionary keys; interning ensures all occurrences share a
+    # single string object, so the key comparisons are just identity checks
+    return intern(vertex) if isinstance(vertex, str) else vertex
 
-def _read_single_edge(json_data: Dict[str, Any]) -> Tuple[str, str, int]:
+
+def _read_single_edge(json_data: Dict[str, Any]) -> _EdgeDefinition:
     if 'start' not in json_data:
         raise ValueError('Edge with undefined start vertex.')
     if 'destination' not in json_data:
         raise ValueError('Edge with undefined destination vertex.')
-    start = json_data['start']
-    destination = json_data['destination']
-    if 'weight' not in json_data:
-        weight = 1
-    else:
-        try:
-            weight = int(json_data['weight'])
-            if weight <= 0:
-                raise ValueError()
-        except ValueError:
-            raise ValueError(f'Invalid weight: {json_data["weight"]}.')
+    start = _read_vertex(json_data['start'])
+    destination = _read_vertex(json_data['destination'])
+    weight = _parse_weight(json_data['weight']) if 'weight' in json_data else 1
     return (start, destination, weight)
 
 
-def _read_edge_list(json_data: Dict[str, Any]) -> Sequence[Tuple[str, str, int]]:
+def _read_edge_list(json_data: Dict[str, Any]) -> Sequence[_EdgeDefinition]:
     if 'edges' not in json_data:
         raise ValueError('Missing edge list.')
     result = [_read_single_edge(single_edge) for single_edge in json_data['edges']]
@@ -64,6 +120,62 @@ def _read_edge_list(json_data: Dict[str, Any]) -> Sequence[Tuple[str, str, int]]
     return result
 
 
+def _read_graph_definition(json_data: Dict[str, Any]) -> _GraphDefinition:
+    return _read_graph_type(json_data), _read_edge_list(json_data)
+
+
+def _parse_graph_definition(json_document: Union[str, bytes]) -> _GraphDefinition:
+    return _read_graph_definition(loads(json_document))
+
+
+def _parse_graph_definition_string(json_string: Union[str, bytes, bytearray]) -> _GraphDefinition:
+    # just JSON strings are cached (streams and files are not); the cache is
+    # keyed by a digest of the content rather than by the string itself, so it
+    # neither keeps whole JSON documents in memory nor requires the string to
+    # be hashable (e.g. bytearray); the graphs are mutable, so just the
+    # (immutable) result of parsing and validation is cached, and a new graph
+    # is built for each invocation
+    content = json_string.encode('utf-8') if isinstance(json_string, str) else json_string
+    key = blake2b(content, digest_size=16).digest()
+    definition = _PARSED_DEFINITION_CACHE.get(key)
+    if definition is None:
+        graph_type, edge_list = _parse_graph_definition(json_string)
+        definition = graph_type, tuple(edge_list)
+        if len(_PARSED_DEFINITION_CACHE) >= _PARSED_DEFINITION_CACHE_SIZE:
+            del _PARSED_DEFINITION_CACHE[next(iter(_PARSED_DEFINITION_CACHE))]
+        _PARSED_DEFINITION_CACHE[key] = definition
+    return definition
+
+
+def _build_adjacency_set_graph(graph_type: GraphType,
+                               edge_list: Sequence[_EdgeDefinition]) -> AdjacencySetGraph:
+    graph = AdjacencySetGraph(graph_type)
+    graph.add_edges(edge_list)
+    return graph
+
+
+def _build_adjacency_matrix_graph(graph_type: GraphType,
+                                  edge_list: Sequence[_EdgeDefinition]) -> AdjacencyMatrixGraph:
+    max_vertex_count = 2 * len(edge_list)
+    graph = AdjacencyMatrixGraph(max_vertex_count, graph_type)
+    graph.add_edges(edge_list)
+    return graph
+
+
+def build_adjacency_set_graph_from_dict(json_data: Dict[str, Any]) -> AdjacencySetGraph:
+    """Creates and returns a new adjacency set graph created according to the
+    given already parsed JSON definition.
+
+    Args:
+        json_data (Dict[str, Any]): The parsed JSON definition of the graph to be
+                                    built.
+
+    Returns:
+        AdjacencySetGraph: The created graph.
+    """
+    return _build_adjacency_set_graph(*_read_graph_definition(json_data))
+
+
 def build_adjacency_set_graph_from_json_string(json_string: str) -> AdjacencySetGraph:
     """Creates and returns a new adjacency set graph created according to the
     JSON definition represented by the given string.
@@ -75,12 +187,23 @@ def build_adjacency_set_graph_from_json_string(json_string: str) -> AdjacencySet
     Returns:
         AdjacencySetGraph: The created graph.
     """
-    json_data = loads(json_string)
-    graph_type = _read_graph_type(json_data)
-    graph = AdjacencySetGraph(graph_type)
-    for start, destination, weight in _read_edge_list(json_data):
-        graph.add_edge(start, destination, weight)
-    return graph
+    return _build_adjacency_set_graph(*_parse_graph_definition_string(json_string))
+
+
+def build_adjacency_set_graph_from_json_stream(stream: IO[AnyStr]) -> AdjacencySetGraph:
+    """Creates and returns a new adjacency set graph created according to the
+    JSON definition read from the given stream.
+
+    Args:
+        stream (IO[AnyStr]): Text or binary stream (e.g. an opened file, or an
+                             io.StringIO instance) carrying the JSON definition
+                             of the graph to be built.
+
+    Returns:
+        AdjacencySetGraph: The created graph.
+    """
+    return _build_adjacency_set_graph(*_parse_graph_definition(stream.read()))
+
 
 def build_adjacency_set_graph_from_json_file(path: str) -> AdjacencySetGraph:
     """Creates and returns a new adjacency set graph created according to the
@@ -93,9 +216,8 @@ def build_adjacency_set_graph_from_json_file(path: str) -> AdjacencySetGraph:
     Returns:
         AdjacencySetGraph: The created graph.
     """
-    with open(path, 'r') as json_file:
-        json_data = "".join(line.rstrip() for line in json_file)
-        return build_adjacency_set_graph_from_json_string(json_data)
+    with open(path, 'rb') as json_file:
+        return build_adjacency_set_graph_from_json_stream(json_file)
 
 
 def build_adjacency_matrix_graph_from_json_string(json_string: str) -> AdjacencyMatrixGraph:
@@ -113,14 +235,44 @@ def build_adjacency_matrix_graph_from_json_string(json_string: str) -> Adjacency
     Returns:
         AdjacencyMatrixGraph: The created graph.
     """
-    json_data = loads(json_string)
-    graph_type = _read_graph_type(json_data)
-    edge_list = _read_edge_list(json_data)
-    max_vertex_count = 2 * len(edge_list)
-    graph = AdjacencyMatrixGraph(max_vertex_count, graph_type)
-    for start, destination, weight in edge_list:
-        graph.add_edge(start, destination, weight)
-    return graph
+    return _build_adjacency_matrix_graph(*_parse_graph_definition_string(json_string))
+
+
+def build_adjacency_matrix_graph_from_dict(json_data: Dict[str, Any]) -> AdjacencyMatrixGraph:
+    """Creates and returns a new adjacency matrix graph created according to the
+    given already parsed JSON definition.
+
+    This method ensures that the underlying adjacency matrix of the created graph
+    has a capacity sufficient to represent the graph described by the given JSON
+    definition.
+
+    Args:
+        json_data (Dict[str, Any]): The parsed JSON definition of the graph to be
+                                    built.
+
+    Returns:
+        AdjacencyMatrixGraph: The created graph.
+    """
+    return _build_adjacency_matrix_graph(*_read_graph_definition(json_data))
+
+
+def build_adjacency_matrix_graph_from_json_stream(stream: IO[AnyStr]) -> AdjacencyMatrixGraph:
+    """Creates and returns a new adjacency matrix graph created according to the
+    JSON definition read from the given stream.
+
+    This method ensures that the underlying adjacency matrix of the created graph
+    has a capacity sufficient to represent the graph described by the given JSON
+    definition.
+
+    Args:
+        stream (IO[AnyStr]): Text or binary stream (e.g. an opened file, or an
+                             io.StringIO instance) carrying the JSON definition
+                             of the graph to be built.
+
+    Returns:
+        AdjacencyMatrixGraph: The created graph.
+    """
+    return _build_adjacency_matrix_graph(*_parse_graph_definition(stream.read()))
 
 
 def build_adjacency_matrix_graph_from_json_file(path: str) -> AdjacencyMatrixGraph:
@@ -137,6 +289,5 @@ def build_adjacency_matrix_graph_from_json_file(path: str) -> AdjacencyMatrixGra
     Returns:
         AdjacencyMatrixGraph: The created graph.
     """
-    with open(path, 'r') as json_file:
-        json_data = "".join(line.rstrip() for line in json_file)
-        return build_adjacency_matrix_graph_from_json_string(json_data)
+    with open(path, 'rb') as json_file:
+        return build_adjacency_matrix_graph_from_json_stream(json_file)
@@ -21,13 +21,17 @@
 of the graph algorithms provided by this library.
 """
 from abc import ABC
-from dataclasses import dataclass, field
+from array import array
 from heapq import heappop, heappush
-from typing import Any, Dict
+from typing import Any, Dict, List, NamedTuple
 
 
-@dataclass(frozen=True)
-class QueueableItem:
+# placeholder replacing the item of a heap entry superseded by an entry with
+# modified priority (see the :class: RepriorizablePriorityQueue)
+_REMOVED = object()
+
+
+class QueueableItem(NamedTuple):
     """Immutable structure carrying a single item that can be enqueued to an
     instance of the :class: RepriorizablePriorityQueue class.
 
@@ -43,19 +47,6 @@ class QueueableItem:
     value: Any = None
 
 
-@dataclass(order=True)
-class _QueueEntry:
-    """Immutable structure carrying a single element currently being present
-    in the priority queue.
-
-    This class is just an internal helper structure, it it not part of the
-    public API of the :class: RepriorizablePriorityQueue class.
-    """
-    priority: int
-    item: Any = field(compare=False)
-    irrelevant: bool = False
-
-
 class _AbstractPriorityQueue(ABC): # pylint: disable=R0903
     """Abstract base class providing functionality common to both priority queue
     implementations provided by this module.
@@ -64,8 +55,13 @@ class _AbstractPriorityQueue(ABC): # pylint: disable=R0903
     def __init__(self):
         """Constructs a new empty simple priority queue.
         """
+        # the heap entries are plain tuples/lists starting with the priority
+        # followed by an unique sequence number, so the heap compares them
+        # without ever comparing the enqueued items themselves; the sequence
+        # number also ensures FIFO order for items with the same priority
         self._heap = []
         self._size = 0
+        self._sequence = 0
 
 
     def is_not_empty(self) -> bool:
@@ -91,8 +87,8 @@ class SimplePriorityQueue(_AbstractPriorityQueue):
                                 this queue.
             item (Any):         The item to be added to this queue.
         """
-        queue_entry = _QueueEntry(priority, item)
-        heappush(self._heap, queue_entry)
+        heappush(self._heap, (priority, self._sequence, item))
+        self._sequence += 1
         self._size += 1
 
     def dequeue(self) -> Any:
@@ -107,9 +103,9 @@ class SimplePriorityQueue(_AbstractPriorityQueue):
         if self._size == 0:
             message = 'Cannot dequeue from empty queue.'
             raise IndexError(message)
-        entry = heappop(self._heap)
+        _, _, item = heappop(self._heap)
         self._size -= 1
-        return entry.item
+        return item
 
 
 class RepriorizablePriorityQueue(_AbstractPriorityQueue):
@@ -121,8 +117,11 @@ class RepriorizablePriorityQueue(_AbstractPriorityQueue):
         """Constructs a new empty repriorizable priority queue.
         """
         super().__init__()
-        self._sequence = 0
-        self._item_map: Dict[Any, _QueueEntry] = {}
+        # the entries are lists [priority, sequence, item]; if the priority of
+        # an item is modified, a new entry is pushed and the item of the former
+        # entry is replaced by the _REMOVED placeholder (lazy deletion), so
+        # the former entry is just skipped once it gets to the top of the heap
+        self._entry_finder: Dict[Any, List] = {}
 
     def enqueue(self, item: QueueableItem):
         """Adds the given item to this queue, using the given priority.
@@ -136,13 +135,15 @@ class RepriorizablePriorityQueue(_AbstractPriorityQueue):
         Args:
             item (QueueableItem): The item to be added to this queue.
         """
-        queue_entry = _QueueEntry(item.priority, item)
-        heappush(self._heap, queue_entry)
-        if item.key in self._item_map:
-            self._item_map[item.key].irrelevant = True
-        else:
+        former_entry = self._entry_finder.get(item.key)
+        if former_entry is None:
             self._size += 1
-        self._item_map[item.key] = queue_entry
+        else:
+            former_entry[2] = _REMOVED
+        queue_entry = [item.priority, self._sequence, item]
+        self._sequence += 1
+        self._entry_finder[item.key] = queue_entry
+        heappush(self._heap, queue_entry)
 
     def dequeue(self) -> QueueableItem:
         """Dequeues the next item from this queue.
@@ -154,18 +155,19 @@ class RepriorizablePriorityQueue(_AbstractPriorityQueue):
             QueueableItem: The dequeued item.
         """
         while len(self._heap) > 0:
-            queue_entry = heappop(self._heap)
-            if queue_entry.irrelevant:
+            _, _, item = heappop(self._heap)
+            if item is _REMOVED:
                 continue
-            self._item_map.pop(queue_entry.item.key)
+            del self._entry_finder[item.key]
             self._size -= 1
-            return queue_entry.item
+            return item
         message = 'Cannot dequeue from empty queue.'
         raise IndexError(message)
 
 
 class UnionFind:
-    """Implementation of union-find (aka disjoint-set) data structure with path compression.
+    """Implementation of union-find (aka disjoint-set) data structure with path compression
+    (path halving) and union by size.
     """
 
     def __init__(self, size: int):
@@ -175,11 +177,9 @@ class UnionFind:
             size (int): The number of elements the constructed instance has to support.
         """
         self._element_count = self._subset_count = size
-        self._element_parents = []
-        self._subset_sizes = []
-        for i in range(size):
-            self._element_parents.append(i)
-            self._subset_sizes.append(1)
+        # compact arrays of C ints rather than lists of int objects
+        self._element_parents = array('i', range(size))
+        self._subset_sizes = array('i', [1]) * size
 
     @property
     def element_count(self) -> int:
@@ -203,23 +203,17 @@ class UnionFind:
         Returns:
             int: The root element of the subset the given element currently belongs to.
         """
-        if self._element_parents[element] == element:
-            return element
-
-        parent_element = self._element_parents[element]
-        while self._element_parents[parent_element] != parent_element:
-            parent_element = self._element_parents[parent_element]
-
-        # path compression - set the root element of the subset as parent for all
-        # members of the subset, thus eliminating longer chaining of elements
-        root_element = parent_element
-        parent_element = self._element_parents[element]
-        self._element_parents[element] = root_element
-        while self._element_parents[parent_element] != parent_element:
-            parent_element = self._element_parents[parent_element]
-            self._element_parents[parent_element] = root_element
-
-        return root_element
+        # path halving - while walking towards the root element of the subset,
+        # each visited element is re-linked to its grandparent, which shortens
+        # the chain for subsequent lookups without a second pass
+        element_parents = self._element_parents
+        parent_element = element_parents[element]
+        while parent_element != element:
+            grandparent_element = element_parents[parent_element]
+            element_parents[element] = grandparent_element
+            element = grandparent_element
+            parent_element = element_parents[element]
+        return element
 
     def subset_size(self, element: int) -> int:
         """Returns the current size of the subset the given element currently belongs
@@ -0,0 +1,118 @@
+#
+# Copyright 2020 Jaroslav Chmurny
+#
+# This file is part of Library of Graph Algorithms for Python.
+#
+# Library of Graph Algorithms for Python is free software developed for
+# educational # and experimental purposes. It is licensed under the Apache
+# License, Version 2.0 # (the "License"); you may not use this file except
+# in compliance with the # License. You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+"""Fixtures shared by the unit tests.
+"""
+
+from importlib.util import find_spec
+from json import loads
+from pathlib import Path
+from typing import Any, Callable, Dict
+
+from pytest import fixture, mark
+
+from graphlib.graph import AbstractGraph, AdjacencyMatrixGraph, AdjacencySetGraph, GraphType
+
+_JSON_FIXTURE_DIR = Path(__file__).parent / 'fixtures'
+
+# none of the graphs created by the tests involves more than 6 vertices
+_MATRIX_GRAPH_CAPACITY = 8
+
+
+def pytest_addoption(parser):
+    """Adds the --run-benchmarks option, which enables the micro-benchmarks.
+    """
+    parser.addoption('--run-benchmarks', action='store_true', default=False,
+                     help='execute the micro-benchmarks (requires the pytest-benchmark plug-in)')
+
+
+def pytest_configure(config):
+    """Registers the benchmark marker, so that it is known even if the
+    pytest-benchmark plug-in (which otherwise registers it) is not installed.
+    """
+    config.addinivalue_line('markers', 'benchmark: micro-benchmark driven by the pytest-benchmark plug-in')
+
+
+def pytest_collection_modifyitems(config, items):
+    """Skips the micro-benchmarks unless the --run-benchmarks option is given
+    (so that they do not slow down ordinary test runs) and the pytest-benchmark
+    plug-in is installed.
+    """
+    if not config.getoption('--run-benchmarks'):
+        skip_benchmark = mark.skip(reason='micro-benchmarks are only executed with --run-benchmarks')
+    elif find_spec('pytest_benchmark') is None:
+        skip_benchmark = mark.skip(reason='pytest-benchmark is not installed')
+    else:
+        return
+    for item in items:
+        if item.get_closest_marker('benchmark') is not None:
+            item.add_marker(skip_benchmark)
+
+
+def _create_adjacency_matrix_graph(graph_type: GraphType) -> AbstractGraph:
+    return AdjacencyMatrixGraph(_MATRIX_GRAPH_CAPACITY, graph_type)
+
+
+@fixture(scope='class', params=[AdjacencySetGraph, _create_adjacency_matrix_graph], ids=['set', 'matrix'])
+def graph_factory(request) -> Callable[[GraphType], AbstractGraph]:
+    """Provides a factory creating an empty graph of the given type. The fixture
+    is parametrized, so tests using it are executed once for each graph
+    implementation (adjacency set, adjacency matrix).
+    """
+    return request.param
+
+
+def _load_json_fixture(name: str) -> Dict[str, Any]:
+    return loads((_JSON_FIXTURE_DIR / name).read_bytes())
+
+
+@fixture(scope='session')
+def json_fixture_dir() -> Path:
+    """Provides the directory containing the JSON graph definitions used by
+    the tests.
+    """
+    return _JSON_FIXTURE_DIR
+
+
+@fixture(scope='session')
+def directed_weighted_definition() -> Dict[str, Any]:
+    """Provides the parsed JSON definition of a directed weighted graph.
+    """
+    return _load_json_fixture('directed_weighted.json')
+
+
+@fixture(scope='session')
+def undirected_weighted_definition() -> Dict[str, Any]:
+    """Provides the parsed JSON definition of an undirected weighted graph.
+    """
+    return _load_json_fixture('undirected_weighted.json')
+
+
+@fixture(scope='session')
+def directed_unweighted_definition() -> Dict[str, Any]:
+    """Provides the parsed JSON definition of a directed unweighted graph.
+    """
+    return _load_json_fixture('directed_unweighted.json')
+
+
+@fixture(scope='session')
+def undirected_unweighted_definition() -> Dict[str, Any]:
+    """Provides the parsed JSON definition of an undirected unweighted graph.
+    """
+    return _load_json_fixture('undirected_unweighted.json')
@@ -20,9 +20,10 @@
 """Unit tests for the graphlib.algorithms module.
 """
 
+from dataclasses import asdict, astuple, fields
 from itertools import permutations
 
-from pytest import raises
+from pytest import fixture, mark, raises
 
 from graphlib.algorithms import MinimumSpanningTreeAlgorithm, ShortestPathSearchRequest, ShortestPathSearchResult
 from graphlib.algorithms import MinimumSpanningTreeSearchRequest, MinimumSpanningTreeSearchResult
@@ -91,10 +92,10 @@ class TestDistanceTable: # pylint: disable=R0201,C0116
         distance_table.update('F', 'E', 12)
         distance_table.update('G', 'F', 15)
 
-        distance_table.backtrack_shortest_path('G') == ShortestPathSearchResult((
+        assert distance_table.backtrack_shortest_path('G') == ShortestPathSearchResult((
             Edge(start='A', destination='B', weight=2),
             Edge(start='B', destination='F', weight=2),
-            Edge(start='F', destination='G', weight=3),
+            Edge(start='F', destination='G', weight=11),
         ))
 
     def test_attempt_to_get_distance_for_non_existent_vertex_leads_to_error(self):
@@ -242,13 +243,40 @@ class TestShortestPathSearchResult: # pylint: disable=R0201,C0116
         assert shortest_path.destination == 'L'
         assert shortest_path.overall_distance == 19
 
+    def test_shortest_path_search_results_are_equal_if_and_only_if_their_paths_are_equal(self):
+        path_one = (
+            Edge(start='A', destination='B', weight=2),
+            Edge(start='B', destination='C', weight=3),
+        )
+        path_two = (
+            Edge(start='A', destination='B', weight=2),
+            Edge(start='B', destination='C', weight=4),
+        )
+
+        assert ShortestPathSearchResult(path_one) == ShortestPathSearchResult(path_one)
+        assert hash(ShortestPathSearchResult(path_one)) == hash(ShortestPathSearchResult(path_one))
+        assert ShortestPathSearchResult(path_one) != ShortestPathSearchResult(path_two)
+        assert ShortestPathSearchResult(path_one) != path_one
+
+    def test_shortest_path_search_result_has_just_the_path_field(self):
+        path = (
+            Edge(start='A', destination='B', weight=2),
+            Edge(start='B', destination='C', weight=3),
+        )
+        shortest_path = ShortestPathSearchResult(path)
+
+        assert [single_field.name for single_field in fields(shortest_path)] == ['path']
+        assert asdict(shortest_path) == {'path': path}
+        assert astuple(shortest_path) == (path,)
+
 
 class TestShortestPathSearchForUnweightedGraphSuiteOne: # pylint: disable=R0201,C0116,C0103
     """Collection of test methods exercising the method :method:
     graphlib.algorithms.find_shortest_path for unweighted graphs.
     """
 
-    def _create_tested_graph(self):
+    @fixture(scope='class')
+    def graph(self):
         graph = AdjacencySetGraph(GraphType.DIRECTED)
         graph.add_edge('A', 'B')
         graph.add_edge('A', 'C')
@@ -260,18 +288,14 @@ class TestShortestPathSearchForUnweightedGraphSuiteOne: # pylint: disable=R0201,
         graph.add_edge('B', 'F')
         return graph
 
-    def test_path_from_A_to_F(self):
-        graph = self._create_tested_graph()
-
+    def test_path_from_A_to_F(self, graph):
         request = ShortestPathSearchRequest(graph, start='A', destination='F')
         assert find_shortest_path(request) == ShortestPathSearchResult((
             Edge(start='A', destination='B', weight=1),
             Edge(start='B', destination='F', weight=1),
         ))
 
-    def test_path_from_A_to_E(self):
-        graph = self._create_tested_graph()
-
+    def test_path_from_A_to_E(self, graph):
         request = ShortestPathSearchRequest(graph, start='A', destination='E')
         assert find_shortest_path(request) == ShortestPathSearchResult((
             Edge(start='A', destination='C', weight=1),
@@ -284,7 +308,8 @@ class TestShortestPathSearchForUnweightedGraphSuiteTwo: # pylint: disable=R0201,
     graphlib.algorithms.find_shortest_path for unweighted graphs.
     """
 
-    def _create_tested_graph(self):
+    @fixture(scope='class')
+    def graph(self):
         graph = AdjacencySetGraph(GraphType.DIRECTED)
         graph.add_edge('A', 'B')
         graph.add_edge('A', 'C')
@@ -299,9 +324,7 @@ class TestShortestPathSearchForUnweightedGraphSuiteTwo: # pylint: disable=R0201,
         graph.add_edge('H', 'I')
         return graph
 
-    def test_path_from_A_to_I(self):
-        graph = self._create_tested_graph()
-
+    def test_path_from_A_to_I(self, graph):
         request = ShortestPathSearchRequest(graph, start='A', destination='I')
         assert find_shortest_path(request) == ShortestPathSearchResult((
             Edge(start='A', destination='C', weight=1),
@@ -311,9 +334,7 @@ class TestShortestPathSearchForUnweightedGraphSuiteTwo: # pylint: disable=R0201,
             Edge(start='H', destination='I', weight=1),
         ))
 
-    def test_path_from_B_to_G(self):
-        graph = self._create_tested_graph()
-
+    def test_path_from_B_to_G(self, graph):
         request = ShortestPathSearchRequest(graph, start='B', destination='G')
         assert find_shortest_path(request) == ShortestPathSearchResult((
             Edge(start='B', destination='D', weight=1),
@@ -328,7 +349,8 @@ class TestShortestPathSearchForUnweightedGraphSuiteThree: # pylint: disable=R020
     graphlib.algorithms.find_shortest_path for unweighted graphs.
     """
 
-    def _create_tested_graph(self):
+    @fixture(scope='class')
+    def graph(self):
         graph = AdjacencySetGraph(GraphType.DIRECTED)
         graph.add_edge('A', 'B')
         graph.add_edge('B', 'C')
@@ -361,9 +383,7 @@ class TestShortestPathSearchForUnweightedGraphSuiteThree: # pylint: disable=R020
         graph.add_edge('P', 'O')
         return graph
 
-    def test_path_from_A_to_D(self):
-        graph = self._create_tested_graph()
-
+    def test_path_from_A_to_D(self, graph):
         request = ShortestPathSearchRequest(graph, start='A', destination='D')
         assert find_shortest_path(request) == ShortestPathSearchResult((
             Edge(start='A', destination='B', weight=1),
@@ -371,18 +391,14 @@ class TestShortestPathSearchForUnweightedGraphSuiteThree: # pylint: disable=R020
             Edge(start='C', destination='D', weight=1),
         ))
 
-    def test_path_from_A_to_I(self):
-        graph = self._create_tested_graph()
-
+    def test_path_from_A_to_I(self, graph):
         request = ShortestPathSearchRequest(graph, start='A', destination='I')
         assert find_shortest_path(request) == ShortestPathSearchResult((
             Edge(start='A', destination='E', weight=1),
             Edge(start='E', destination='I', weight=1),
         ))
 
-    def test_path_from_A_to_M(self):
-        graph = self._create_tested_graph()
-
+    def test_path_from_A_to_M(self, graph):
         request = ShortestPathSearchRequest(graph, start='A', destination='M')
         assert find_shortest_path(request) == ShortestPathSearchResult((
             Edge(start='A', destination='B', weight=1),
@@ -393,9 +409,7 @@ class TestShortestPathSearchForUnweightedGraphSuiteThree: # pylint: disable=R020
             Edge(start='N', destination='M', weight=1),
         ))
 
-    def test_path_from_A_to_P(self):
-        graph = self._create_tested_graph()
-
+    def test_path_from_A_to_P(self, graph):
         request = ShortestPathSearchRequest(graph, start='A', destination='P')
         assert find_shortest_path(request) == ShortestPathSearchResult((
             Edge(start='A', destination='B', weight=1),
@@ -407,9 +421,7 @@ class TestShortestPathSearchForUnweightedGraphSuiteThree: # pylint: disable=R020
             Edge(start='O', destination='P', weight=1),
         ))
 
-    def test_path_from_P_to_A(self):
-        graph = self._create_tested_graph()
-
+    def test_path_from_P_to_A(self, graph):
         request = ShortestPathSearchRequest(graph, start='P', destination='A')
         assert find_shortest_path(request) == ShortestPathSearchResult((
             Edge(start='P', destination='J', weight=1),
@@ -417,9 +429,7 @@ class TestShortestPathSearchForUnweightedGraphSuiteThree: # pylint: disable=R020
             Edge(start='F', destination='A', weight=1),
         ))
 
-    def test_path_from_P_to_C(self):
-        graph = self._create_tested_graph()
-
+    def test_path_from_P_to_C(self, graph):
         request = ShortestPathSearchRequest(graph, start='P', destination='C')
         assert find_shortest_path(request) == ShortestPathSearchResult((
             Edge(start='P', destination='J', weight=1),
@@ -429,9 +439,7 @@ class TestShortestPathSearchForUnweightedGraphSuiteThree: # pylint: disable=R020
             Edge(start='B', destination='C', weight=1),
         ))
 
-    def test_path_from_P_to_G(self):
-        graph = self._create_tested_graph()
-
+    def test_path_from_P_to_G(self, graph):
         request = ShortestPathSearchRequest(graph, start='P', destination='G')
         assert find_shortest_path(request) == ShortestPathSearchResult((
             Edge(start='P', destination='J', weight=1),
@@ -439,9 +447,7 @@ class TestShortestPathSearchForUnweightedGraphSuiteThree: # pylint: disable=R020
             Edge(start='F', destination='G', weight=1),
         ))
 
-    def test_path_from_P_to_M(self):
-        graph = self._create_tested_graph()
-
+    def test_path_from_P_to_M(self, graph):
         request = ShortestPathSearchRequest(graph, start='P', destination='M')
         assert find_shortest_path(request) == ShortestPathSearchResult((
             Edge(start='P', destination='J', weight=1),
@@ -455,7 +461,8 @@ class TestShortestPathSearchForWeightedGraphSuiteOne: # pylint: disable=R0201,C0
     graphlib.algorithms.find_shortest_path for weighted graphs.
     """
 
-    def _create_tested_graph(self):
+    @fixture(scope='class')
+    def graph(self):
         graph = AdjacencySetGraph(GraphType.DIRECTED)
         graph.add_edge('A', 'B', 2)
         graph.add_edge('A', 'C', 4)
@@ -471,55 +478,36 @@ class TestShortestPathSearchForWeightedGraphSuiteOne: # pylint: disable=R0201,C0
         graph.add_edge('F', 'G', 2)
         return graph
 
-    def test_path_from_A_to_G(self):
-        graph = self._create_tested_graph()
-
-        request = ShortestPathSearchRequest(graph, start='A', destination='G')
-        assert find_shortest_path(request) == ShortestPathSearchResult((
+    @mark.parametrize('start, destination, expected_path', [
+        ('A', 'G', (
             Edge(start='A', destination='B', weight=2),
             Edge(start='B', destination='C', weight=1),
             Edge(start='C', destination='F', weight=3),
             Edge(start='F', destination='G', weight=2),
-        ))
-
-    def test_path_from_B_to_G(self):
-        graph = self._create_tested_graph()
-
-        request = ShortestPathSearchRequest(graph, start='B', destination='G')
-        assert find_shortest_path(request) == ShortestPathSearchResult((
+        )),
+        ('B', 'G', (
             Edge(start='B', destination='C', weight=1),
             Edge(start='C', destination='F', weight=3),
             Edge(start='F', destination='G', weight=2),
-        ))
-
-    def test_path_from_D_to_G(self):
-        graph = self._create_tested_graph()
-
-        request = ShortestPathSearchRequest(graph, start='D', destination='G')
-        assert find_shortest_path(request) == ShortestPathSearchResult((
+        )),
+        ('D', 'G', (
             Edge(start='D', destination='C', weight=3),
             Edge(start='C', destination='F', weight=3),
             Edge(start='F', destination='G', weight=2),
-        ))
-
-    def test_path_from_A_to_E(self):
-        graph = self._create_tested_graph()
-
-        request = ShortestPathSearchRequest(graph, start='A', destination='E')
-        assert find_shortest_path(request) == ShortestPathSearchResult((
+        )),
+        ('A', 'E', (
             Edge(start='A', destination='B', weight=2),
             Edge(start='B', destination='E', weight=5),
-        ))
-
-    def test_path_from_D_to_E(self):
-        graph = self._create_tested_graph()
-
-        search_request = ShortestPathSearchRequest(graph, start='D', destination='E')
-        assert find_shortest_path(search_request) == ShortestPathSearchResult((
+        )),
+        ('D', 'E', (
             Edge(start='D', destination='C', weight=3),
             Edge(start='C', destination='F', weight=3),
             Edge(start='F', destination='E', weight=5),
-        ))
+        )),
+    ])
+    def test_shortest_path(self, graph, start, destination, expected_path):
+        request = ShortestPathSearchRequest(graph, start=start, destination=destination)
+        assert find_shortest_path(request) == ShortestPathSearchResult(expected_path)
 
 
 class TestShortestPathSearchForWeightedGraphSuiteTwo: # pylint: disable=R0201,C0116,C0103
@@ -527,7 +515,8 @@ class TestShortestPathSearchForWeightedGraphSuiteTwo: # pylint: disable=R0201,C0
     graphlib.algorithms.find_shortest_path for weighted graphs.
     """
 
-    def _create_tested_graph(self):
+    @fixture(scope='class')
+    def graph(self):
         graph = AdjacencySetGraph(GraphType.DIRECTED)
         graph.add_edge('A', 'D', 3)
         graph.add_edge('B', 'D', 2)
@@ -542,36 +531,27 @@ class TestShortestPathSearchForWeightedGraphSuiteTwo: # pylint: disable=R0201,C0
         graph.add_edge('H', 'G', 4)
         return graph
 
-    def test_path_from_A_to_G(self):
-        graph = self._create_tested_graph()
-
-        request = ShortestPathSearchRequest(graph, start='A', destination='G')
-        assert find_shortest_path(request) == ShortestPathSearchResult((
+    @mark.parametrize('start, destination, expected_path', [
+        ('A', 'G', (
             Edge(start='A', destination='D', weight=3),
             Edge(start='D', destination='G', weight=6),
-        ))
-
-    def test_path_from_A_to_H(self):
-        graph = self._create_tested_graph()
-
-        request = ShortestPathSearchRequest(graph, start='A', destination='H')
-        assert find_shortest_path(request) == ShortestPathSearchResult((
+        )),
+        ('A', 'H', (
             Edge(start='A', destination='D', weight=3),
             Edge(start='D', destination='C', weight=2),
             Edge(start='C', destination='E', weight=2),
             Edge(start='E', destination='F', weight=1),
             Edge(start='F', destination='H', weight=2),
-        ))
-
-    def test_path_from_C_to_G(self):
-        graph = self._create_tested_graph()
-
-        request = ShortestPathSearchRequest(graph, start='C', destination='G')
-        assert find_shortest_path(request) == ShortestPathSearchResult((
+        )),
+        ('C', 'G', (
             Edge(start='C', destination='E', weight=2),
             Edge(start='E', destination='F', weight=1),
             Edge(start='F', destination='G', weight=3),
-        ))
+        )),
+    ])
+    def test_shortest_path(self, graph, start, destination, expected_path):
+        request = ShortestPathSearchRequest(graph, start=start, destination=destination)
+        assert find_shortest_path(request) == ShortestPathSearchResult(expected_path)
 
 
 class TestShortestPathSearchForWeightedGraphSuiteThree: # pylint: disable=R0201,C0116,C0103
@@ -579,7 +559,8 @@ class TestShortestPathSearchForWeightedGraphSuiteThree: # pylint: disable=R0201,
     graphlib.algorithms.find_shortest_path for weighted graphs.
     """
 
-    def _create_tested_graph(self):
+    @fixture(scope='class')
+    def graph(self):
         graph = AdjacencySetGraph(GraphType.DIRECTED)
         graph.add_edge('A', 'C', 14)
         graph.add_edge('A', 'D', 3)
@@ -615,34 +596,21 @@ class TestShortestPathSearchForWeightedGraphSuiteThree: # pylint: disable=R0201,
         graph.add_edge('S', 'U', 17)
         return graph
 
-    def test_path_from_A_to_J(self):
-        graph = self._create_tested_graph()
-
-        request = ShortestPathSearchRequest(graph, start='A', destination='J')
-        assert find_shortest_path(request) == ShortestPathSearchResult((
+    @mark.parametrize('start, destination, expected_path', [
+        ('A', 'J', (
             Edge(start='A', destination='D', weight=3),
             Edge(start='D', destination='G', weight=4),
             Edge(start='G', destination='C', weight=5),
             Edge(start='C', destination='F', weight=4),
             Edge(start='F', destination='J', weight=7),
-        ))
-
-    def test_path_from_B_to_I(self):
-        graph = self._create_tested_graph()
-
-        request = ShortestPathSearchRequest(graph, start='B', destination='I')
-        assert find_shortest_path(request) == ShortestPathSearchResult((
+        )),
+        ('B', 'I', (
             Edge(start='B', destination='D', weight=5),
             Edge(start='D', destination='H', weight=4),
             Edge(start='H', destination='E', weight=3),
             Edge(start='E', destination='I', weight=2),
-        ))
-
-    def test_path_from_B_to_M(self):
-        graph = self._create_tested_graph()
-
-        request = ShortestPathSearchRequest(graph, start='B', destination='M')
-        assert find_shortest_path(request) == ShortestPathSearchResult((
+        )),
+        ('B', 'M', (
             Edge(start='B', destination='D', weight=5),
             Edge(start='D', destination='G', weight=4),
             Edge(start='G', destination='C', weight=5),
@@ -651,24 +619,14 @@ class TestShortestPathSearchForWeightedGraphSuiteThree: # pylint: disable=R0201,
             Edge(start='J', destination='N', weight=6),
             Edge(start='N', destination='Q', weight=4),
             Edge(start='Q', destination='M', weight=5),
-        ))
-
-    def test_path_from_K_to_L(self):
-        graph = self._create_tested_graph()
-
-        request = ShortestPathSearchRequest(graph, start='K', destination='L')
-        assert find_shortest_path(request) == ShortestPathSearchResult((
+        )),
+        ('K', 'L', (
             Edge(start='K', destination='H', weight=22),
             Edge(start='H', destination='E', weight=3),
             Edge(start='E', destination='I', weight=2),
             Edge(start='I', destination='L', weight=3),
-        ))
-
-    def test_path_from_L_to_M(self):
-        graph = self._create_tested_graph()
-
-        request = ShortestPathSearchRequest(graph, start='L', destination='M')
-        assert find_shortest_path(request) == ShortestPathSearchResult((
+        )),
+        ('L', 'M', (
             Edge(start='L', destination='P', weight=2),
             Edge(start='P', destination='S', weight=6),
             Edge(start='S', destination='O', weight=4),
@@ -676,7 +634,11 @@ class TestShortestPathSearchForWeightedGraphSuiteThree: # pylint: disable=R0201,
             Edge(start='R', destination='N', weight=6),
             Edge(start='N', destination='Q', weight=4),
             Edge(start='Q', destination='M', weight=5),
-        ))
+        )),
+    ])
+    def test_shortest_path(self, graph, start, destination, expected_path):
+        request = ShortestPathSearchRequest(graph, start=start, destination=destination)
+        assert find_shortest_path(request) == ShortestPathSearchResult(expected_path)
 
 
 class TestShortestPathSearchForWeightedGraphSuiteFour: # pylint: disable=R0201,C0116,C0103
@@ -684,7 +646,8 @@ class TestShortestPathSearchForWeightedGraphSuiteFour: # pylint: disable=R0201,C
     graphlib.algorithms.find_shortest_path for weighted graphs.
     """
 
-    def _create_tested_graph(self):
+    @fixture(scope='class')
+    def graph(self):
         graph = AdjacencySetGraph(GraphType.DIRECTED)
         graph.add_edge('A', 'B', 2)
         graph.add_edge('C', 'B', 3)
@@ -705,11 +668,8 @@ class TestShortestPathSearchForWeightedGraphSuiteFour: # pylint: disable=R0201,C
         graph.add_edge('K', 'L', 3)
         return graph
 
-    def test_path_from_A_to_J(self):
-        graph = self._create_tested_graph()
-
-        request = ShortestPathSearchRequest(graph, start='A', destination='J')
-        assert find_shortest_path(request) == ShortestPathSearchResult((
+    @mark.parametrize('start, destination, expected_path', [
+        ('A', 'J', (
             Edge(start='A', destination='B', weight=2),
             Edge(start='B', destination='E', weight=3),
             Edge(start='E', destination='D', weight=2),
@@ -717,19 +677,18 @@ class TestShortestPathSearchForWeightedGraphSuiteFour: # pylint: disable=R0201,C
             Edge(start='G', destination='H', weight=4),
             Edge(start='H', destination='K', weight=3),
             Edge(start='K', destination='J', weight=2),
-        ))
-
-    def test_path_from_F_to_I(self):
-        graph = self._create_tested_graph()
-
-        request = ShortestPathSearchRequest(graph, start='F', destination='I')
-        assert find_shortest_path(request) == ShortestPathSearchResult((
+        )),
+        ('F', 'I', (
             Edge(start='F', destination='E', weight=5),
             Edge(start='E', destination='D', weight=2),
             Edge(start='D', destination='G', weight=2),
             Edge(start='G', destination='H', weight=4),
             Edge(start='H', destination='I', weight=2),
-        ))
+        )),
+    ])
+    def test_shortest_path(self, graph, start, destination, expected_path):
+        request = ShortestPathSearchRequest(graph, start=start, destination=destination)
+        assert find_shortest_path(request) == ShortestPathSearchResult(expected_path)
 
 
 class TestMinimumSpanningTreeSearchResult: # pylint: disable=R0201,C0116
@@ -751,6 +710,12 @@ class TestMinimumSpanningTreeSearchResult: # pylint: disable=R0201,C0116
 
         assert minimum_spanning_tree.overall_weight == 12
 
+    def test_overall_weight_is_not_a_field(self):
+        minimum_spanning_tree = self._create_minimum_spanning_tree()
+
+        assert [single_field.name for single_field in fields(minimum_spanning_tree)] == ['algorithm', 'search_start', 'edges']
+        assert '_overall_weight' not in asdict(minimum_spanning_tree)
+
     def test_len_function_provides_number_of_edges(self):
         minimum_spanning_tree = self._create_minimum_spanning_tree()
 
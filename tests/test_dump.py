@@ -23,26 +23,11 @@
 from io import StringIO
 
 from graphlib.dump import dump_graph, dump_minimum_spanning_tree, dump_shortest_path
+from graphlib.dump import dump_graph_to_str, dump_shortest_path_to_str
 from graphlib.graph import AdjacencySetGraph, GraphType
 from graphlib.algorithms import Edge, MinimumSpanningTreeAlgorithm, MinimumSpanningTreeSearchResult, ShortestPathSearchResult
 
-class TestDumpGraph: # pylint: disable=R0201,C0116
-    """Collection of test methods exercising the :method:
-    graphlib.dump.dump_graph.
-    """
-    
-    def test_graph_is_dumped_properly_for_directed_weighted_graph(self):
-        graph = AdjacencySetGraph(GraphType.DIRECTED)
-        graph.add_edge('A', 'B', 3)
-        graph.add_edge('A', 'C', 2)
-        graph.add_edge('B', 'D', 5)
-        graph.add_edge('C', 'D', 4)
-
-        with StringIO() as output:
-            dump_graph(graph, output)
-            result = output.getvalue()
-        
-        assert result == """
+_EXPECTED_DIRECTED = """
 Graph type: GraphType.DIRECTED
 Weighted: YES
 Vertices (totally 4):
@@ -57,17 +42,7 @@ Edges:
  - C -> D (weight = 4)
 """
 
-    def test_graph_is_dumped_properly_for_undirected_unweighted_graph(self):
-        graph = AdjacencySetGraph(GraphType.UNDIRECTED)
-        graph.add_edge('A', 'B')
-        graph.add_edge('A', 'C')
-        graph.add_edge('B', 'C')
-
-        with StringIO() as output:
-            dump_graph(graph, output)
-            result = output.getvalue()
-        
-        assert result == """
+_EXPECTED_UNDIRECTED = """
 Graph type: GraphType.UNDIRECTED
 Weighted: NO
 Vertices (totally 3):
@@ -83,32 +58,93 @@ Edges:
  - C -> B (weight = 1)
 """
 
+_EXPECTED_UNWEIGHTED_DISTINCT_FROM_ONE = """
+Graph type: GraphType.DIRECTED
+Weighted: NO
+Vertices (totally 3):
+ - A
+ - B
+ - C
+Edges:
+ - A -> B (weight = 4)
+ - B -> C (weight = 4)
+"""
+
+_EXPECTED_SHORTEST_PATH = """
+Shortest path from A to D
+Overall distance 10
+Path:
+ - A -> B (weight = 3)
+ - B -> C (weight = 2)
+ - C -> D (weight = 5)
+"""
+
+_PATH = (
+    Edge(start='A', destination='B', weight=3),
+    Edge(start='B', destination='C', weight=2),
+    Edge(start='C', destination='D', weight=5),
+)
+
+_SHORTEST_PATH = ShortestPathSearchResult(_PATH)
+
+
+class TestDumpGraph: # pylint: disable=R0201,C0116
+    """Collection of test methods exercising the :method:
+    graphlib.dump.dump_graph and the :method:
+    graphlib.dump.dump_graph_to_str.
+    """
+    
+    def test_graph_is_dumped_properly_for_directed_weighted_graph(self):
+        graph = AdjacencySetGraph(GraphType.DIRECTED)
+        graph.add_edge('A', 'B', 3)
+        graph.add_edge('A', 'C', 2)
+        graph.add_edge('B', 'D', 5)
+        graph.add_edge('C', 'D', 4)
+
+        assert dump_graph_to_str(graph) == _EXPECTED_DIRECTED
+
+    def test_graph_is_dumped_properly_for_undirected_unweighted_graph(self):
+        graph = AdjacencySetGraph(GraphType.UNDIRECTED)
+        graph.add_edge('A', 'B')
+        graph.add_edge('A', 'C')
+        graph.add_edge('B', 'C')
+
+        assert dump_graph_to_str(graph) == _EXPECTED_UNDIRECTED
+
+    def test_graph_is_dumped_properly_for_unweighted_graph_with_weight_distinct_from_one(self):
+        graph = AdjacencySetGraph(GraphType.DIRECTED)
+        graph.add_edge('A', 'B', 4)
+        graph.add_edge('B', 'C', 4)
+
+        assert dump_graph_to_str(graph) == _EXPECTED_UNWEIGHTED_DISTINCT_FROM_ONE
+
+    def test_graph_is_written_to_output(self):
+        graph = AdjacencySetGraph(GraphType.DIRECTED)
+        graph.add_edge('A', 'B', 3)
+        graph.add_edge('A', 'C', 2)
+
+        with StringIO() as output:
+            dump_graph(graph, output)
+            result = output.getvalue()
+
+        assert result == dump_graph_to_str(graph)
+
 
 class TestDumpShortestPath: # pylint: disable=R0201,C0116
     """Collection of test methods exercising the :method:
-    graphlib.dump.dump_shortest_path.
+    graphlib.dump.dump_shortest_path and the :method:
+    graphlib.dump.dump_shortest_path_to_str.
     """
 
     def test_shortest_path_is_dumped_properly(self):
-        path = (
-            Edge(start='A', destination='B', weight=3),
-            Edge(start='B', destination='C', weight=2),
-            Edge(start='C', destination='D', weight=5),
-        )
-        shortest_path = ShortestPathSearchResult(path)
+        assert dump_shortest_path_to_str(_SHORTEST_PATH) == _EXPECTED_SHORTEST_PATH
 
+    def test_shortest_path_is_written_to_output(self):
         with StringIO() as output:
-            dump_shortest_path(shortest_path, output)
+            dump_shortest_path(_SHORTEST_PATH, output)
             result = output.getvalue()
-        
-        assert result == """
-Shortest path from A to D
-Overall distance 10
-Path:
- - A -> B (weight = 3)
- - B -> C (weight = 2)
- - C -> D (weight = 5)
-"""
+
+        assert result == dump_shortest_path_to_str(_SHORTEST_PATH)
 
 
 class TestDumpMinimumSpanningTree:
@@ -20,70 +20,59 @@
 """Unit tests for the graphlib.graph module.
 """
 
-from abc import ABC, abstractmethod
+import re
+from typing import Callable
 
-from pytest import raises
+from pytest import fixture, mark, raises
 
-from graphlib.graph import AbstractGraph, AdjacencyMatrixGraph, AdjacencySetGraph, Edge, GraphType
+from graphlib.graph import AbstractGraph, AdjacencyMatrixGraph, Edge, GraphType
 
 # pylint: disable=R0201,C0116,C0301
 
+_VERTEX_NOT_FOUND_RE = re.compile(r'Vertex with the name X not found\.')
 
-class AbstractGraphTestFixture(ABC):
-    """Abstract test-fixture class that implements test methods common to various
-    graph implementations like adjacency matrix or adjacency set.
+_NO_EDGE_FROM_B_TO_A_RE = re.compile(r'There is no edge from B to A\.')
 
-    This class is supposed to be used as base class for test fixtures for specific
-    graph implementations. In concrete terms, a separate subclass per graph
-    implementation is the most likely design. The test methods provided by this
-    abstract base class use the :method: AbstractGraphTestFixture._create_graph
-    to instantiate the proper graph implementation. Derived classes are supposed
-    to implement the above mentioned abstract method.
-    """
-
-    @abstractmethod
-    def _create_graph(self, graph_type: GraphType) -> AbstractGraph:
-        """Factory method that is supposed to create the tested graph.
-
-        Args:
-            graph_type (GraphType): The graph type to be created
-                                    (directed/undirected).
+_CAPACITY_EXCEEDED_RE = re.compile(r'Cannot add more than 2 vertices\.')
 
-        Raises:
-            NotImplementedError: Always as this is just an abstract method.
+_INVALID_EDGE_RE = re.compile(r"Invalid edge \('A', 'B', 3, 4\), expected \(vertex one, vertex two\[, weight\]\)\.")
 
-        Returns:
-            AbstractGraph: Derived classes are supposed to return an instance
-                           of a concrete subclass of the :class:
-                           graphlib.graph.AbstractGraph.
-        """
-        raise NotImplementedError
+# edges of the graph shared by the read-only test methods (start, destination, weight)
+_CANONICAL_EDGES = (
+    ('A', 'B', 2),
+    ('A', 'C', 3),
+    ('B', 'C', 5),
+    ('B', 'E', 4),
+    ('C', 'D', 7),
+    ('D', 'F', 3),
+    ('F', 'E', 5),
+)
 
-    def test_graph_with_all_edges_having_the_same_weight_is_unweighted(self):
-        graph = self._create_graph(GraphType.DIRECTED)
-        graph.add_edge('A', 'B', 3)
-        graph.add_edge('A', 'C', 3)
-        graph.add_edge('B', 'C', 3)
-        graph.add_edge('C', 'D', 3)
 
-        assert not graph.is_weighted
+def _create_canonical_graph(graph_factory: Callable[[GraphType], AbstractGraph],
+                            graph_type: GraphType, weighted: bool) -> AbstractGraph:
+    graph = graph_factory(graph_type)
+    if weighted:
+        graph.add_edges(_CANONICAL_EDGES)
+    else:
+        graph.add_edges((start, destination) for start, destination, _ in _CANONICAL_EDGES)
+    return graph
 
-    def test_graph_with_edges_having_distinct_weights_is_weighted(self):
-        graph = self._create_graph(GraphType.DIRECTED)
-        graph.add_edge('A', 'B', 2)
-        graph.add_edge('A', 'C', 3)
-        graph.add_edge('B', 'C', 2)
-        graph.add_edge('C', 'D', 4)
 
-        assert graph.is_weighted
+class TestGraphGrowth:
+    """Collection of test methods verifying how a graph evolves as edges are
+    added to it, and what it provides once it has been built by the test
+    method itself, common to all graph implementations (i.e. the :class:
+    graphlib.graph.AdjacencySetGraph and the :class:
+    graphlib.graph.AdjacencyMatrixGraph).
 
-    def test_empty_graph_has_no_vertices(self):
-        graph = self._create_graph(GraphType.DIRECTED)
-        assert graph.vertex_count == 0, 'Vertex count'
-        assert graph.get_all_vertices() == (), 'Vertices'
+    Each test method creates its own graph via the graph_factory fixture (see
+    conftest.py), so each test method is executed once per graph
+    implementation.
+    """
 
-    def test_non_empty_graph_returns_proper_number_of_vertices(self):
-        graph = self._create_graph(GraphType.DIRECTED)
+    def test_non_empty_graph_returns_proper_number_of_vertices(self, graph_factory):
+        graph = graph_factory(GraphType.DIRECTED)
 
         graph.add_edge('A', 'B')
         assert graph.vertex_count == 2, 'After A -> B'
@@ -106,8 +95,8 @@ class AbstractGraphTestFixture(ABC):
         graph.add_edge('F', 'E')
         assert graph.vertex_count == 6, 'After F -> E'
 
-    def test_non_empty_graph_returns_proper_list_of_vertices(self):
-        graph = self._create_graph(GraphType.DIRECTED)
+    def test_non_empty_graph_returns_proper_list_of_vertices(self, graph_factory):
+        graph = graph_factory(GraphType.DIRECTED)
 
         graph.add_edge('A', 'B')
         assert graph.get_all_vertices(sort=True) == ('A', 'B'), 'After A -> B'
@@ -130,61 +119,67 @@ class AbstractGraphTestFixture(ABC):
         graph.add_edge('F', 'E')
         assert graph.get_all_vertices(sort=True) == ('A', 'B', 'C', 'D', 'E', 'F'), 'After F -> E'
 
-    def test_proper_in_degree_is_returned(self):
-        graph = self._create_graph(GraphType.DIRECTED)
-        graph.add_edge('A', 'B')
-        graph.add_edge('A', 'C')
-        graph.add_edge('B', 'C')
-        graph.add_edge('B', 'E')
-        graph.add_edge('C', 'D')
-        graph.add_edge('D', 'F')
-        graph.add_edge('F', 'E')
+    def test_vertices_added_in_reverse_order_and_self_loops_are_sorted_without_duplicates(self, graph_factory):
+        graph = graph_factory(GraphType.DIRECTED)
+        graph.add_edges([
+            ('D', 'D'),
+            ('C', 'B'),
+            ('B', 'A'),
+            ('A', 'D'),
+        ])
 
-        assert graph.get_in_degree('A') == 0
-        assert graph.get_in_degree('B') == 1
-        assert graph.get_in_degree('C') == 2
-        assert graph.get_in_degree('D') == 1
-        assert graph.get_in_degree('E') == 2
-        assert graph.get_in_degree('F') == 1
-
-    def test_proper_edge_weights_are_returned_for_directed_graph(self):
-        graph = self._create_graph(GraphType.DIRECTED)
-        graph.add_edge('A', 'B', 2)
-        graph.add_edge('A', 'C', 3)
-        graph.add_edge('B', 'C', 5)
-        graph.add_edge('B', 'E', 4)
-        graph.add_edge('C', 'D', 7)
-        graph.add_edge('D', 'F', 3)
-        graph.add_edge('F', 'E', 5)
-
-        assert graph.get_edge_weight('A', 'B') == 2, 'A -> B'
-        assert graph.get_edge_weight('A', 'C') == 3, 'A -> C'
-        assert graph.get_edge_weight('B', 'C') == 5, 'B -> C'
-        assert graph.get_edge_weight('B', 'E') == 4, 'B -> E'
-        assert graph.get_edge_weight('C', 'D') == 7, 'C -> D'
-        assert graph.get_edge_weight('D', 'F') == 3, 'D -> F'
-        assert graph.get_edge_weight('F', 'E') == 5, 'F -> E'
-
-    def test_proper_edge_weights_for_both_directions_are_returned_for_undirected_graph(self):
-        graph = self._create_graph(GraphType.UNDIRECTED)
-        graph.add_edge('A', 'B', 2)
-        graph.add_edge('A', 'C', 3)
-        graph.add_edge('B', 'C', 5)
-        graph.add_edge('B', 'E', 4)
-        graph.add_edge('C', 'D', 7)
-        graph.add_edge('D', 'F', 3)
-        graph.add_edge('F', 'E', 5)
-
-        assert graph.get_edge_weight('A', 'B') == graph.get_edge_weight('B', 'A') == 2, 'A <-> B'
-        assert graph.get_edge_weight('A', 'C') == graph.get_edge_weight('C', 'A') == 3, 'A <-> C'
-        assert graph.get_edge_weight('B', 'C') == graph.get_edge_weight('C', 'B') == 5, 'B <-> C'
-        assert graph.get_edge_weight('B', 'E') == graph.get_edge_weight('E', 'B') == 4, 'B <-> E'
-        assert graph.get_edge_weight('C', 'D') == graph.get_edge_weight('D', 'C') == 7, 'C <-> D'
-        assert graph.get_edge_weight('D', 'F') == graph.get_edge_weight('F', 'D') == 3, 'D <-> F'
-        assert graph.get_edge_weight('F', 'E') == graph.get_edge_weight('E', 'F') == 5, 'F <-> E'
-
-    def test_one_is_used_as_default_for_directed_graph_if_edge_weight_is_omitted(self):
-        graph = self._create_graph(GraphType.DIRECTED)
+        assert graph.get_all_vertices(sort=True) == ('A', 'B', 'C', 'D')
+
+    def test_vertex_names_do_not_have_to_be_comparable_unless_sorted_vertices_are_requested(self, graph_factory):
+        graph = graph_factory(GraphType.DIRECTED)
+        graph.add_edge(1, 'B')
+
+        assert set(graph.get_all_vertices()) == {1, 'B'}
+
+    def test_attempt_to_add_edge_with_too_many_elements_leads_to_error(self, graph_factory):
+        graph = graph_factory(GraphType.DIRECTED)
+
+        with raises(ValueError, match=_INVALID_EDGE_RE):
+            graph.add_edges([('A', 'B', 3, 4)])
+
+    def test_edges_preceding_malformed_edge_remain_added_after_error(self, graph_factory):
+        graph = graph_factory(GraphType.DIRECTED)
+
+        with raises(ValueError, match=_INVALID_EDGE_RE):
+            graph.add_edges([('C', 'D', 2), ('A', 'B', 3, 4), ('E', 'F')])
+
+        assert graph.get_all_vertices(sort=True) == ('C', 'D')
+        assert graph.get_edge_weight('C', 'D') == 2
+
+    def test_graph_with_all_edges_having_the_same_weight_is_unweighted(self, graph_factory):
+        graph = graph_factory(GraphType.DIRECTED)
+        graph.add_edges([
+            ('A', 'B', 3),
+            ('A', 'C', 3),
+            ('B', 'C', 3),
+            ('C', 'D', 3),
+        ])
+
+        assert not graph.is_weighted
+
+    def test_graph_with_edges_having_distinct_weights_is_weighted(self, graph_factory):
+        graph = graph_factory(GraphType.DIRECTED)
+        graph.add_edges([
+            ('A', 'B', 2),
+            ('A', 'C', 3),
+            ('B', 'C', 2),
+            ('C', 'D', 4),
+        ])
+
+        assert graph.is_weighted
+
+    def test_empty_graph_has_no_vertices(self, graph_factory):
+        graph = graph_factory(GraphType.DIRECTED)
+        assert graph.vertex_count == 0, 'Vertex count'
+        assert graph.get_all_vertices() == (), 'Vertices'
+
+    def test_one_is_used_as_default_for_directed_graph_if_edge_weight_is_omitted(self, graph_factory):
+        graph = graph_factory(GraphType.DIRECTED)
         graph.add_edge('A', 'B')
         graph.add_edge('A', 'C')
         graph.add_edge('B', 'C')
@@ -193,8 +188,20 @@ class AbstractGraphTestFixture(ABC):
         assert graph.get_edge_weight('A', 'C') == 1, 'A -> C'
         assert graph.get_edge_weight('B', 'C') == 1, 'B -> C'
 
-    def test_one_is_used_as_default_for_both_directions_for_undirected_graph_if_edge_weight_is_omitted(self):
-        graph = self._create_graph(GraphType.UNDIRECTED)
+    def test_add_edges_accepts_edges_with_and_without_explicit_weight(self, graph_factory):
+        graph = graph_factory(GraphType.DIRECTED)
+        graph.add_edges([
+            ('A', 'B', 3),
+            ('A', 'C'),
+            ('B', 'C', 5),
+        ])
+
+        assert graph.get_edge_weight('A', 'B') == 3, 'A -> B'
+        assert graph.get_edge_weight('A', 'C') == 1, 'A -> C'
+        assert graph.get_edge_weight('B', 'C') == 5, 'B -> C'
+
+    def test_one_is_used_as_default_for_both_directions_for_undirected_graph_if_edge_weight_is_omitted(self, graph_factory):
+        graph = graph_factory(GraphType.UNDIRECTED)
         graph.add_edge('A', 'B')
         graph.add_edge('A', 'C')
         graph.add_edge('B', 'C')
@@ -203,48 +210,14 @@ class AbstractGraphTestFixture(ABC):
         assert graph.get_edge_weight('A', 'C') == graph.get_edge_weight('C', 'A') == 1, 'A <-> C'
         assert graph.get_edge_weight('B', 'C') == graph.get_edge_weight('C', 'B') == 1, 'B <-> C'
 
-    def test_proper_adjacent_vertices_are_returned_for_directed_graph(self):
-        # be aware of the fact that this test case also covers vertices that are
-        # only the destination of an edge (they are not the start of any edge)
-        graph = self._create_graph(GraphType.DIRECTED)
-        graph.add_edge('A', 'B')
-        graph.add_edge('A', 'C')
-        graph.add_edge('B', 'C')
-        graph.add_edge('B', 'E')
-        graph.add_edge('C', 'D')
-        graph.add_edge('D', 'F')
-        graph.add_edge('F', 'E')
-
-        assert graph.get_adjacent_vertices('A') == ('B', 'C'), 'A'
-        assert graph.get_adjacent_vertices('B') == ('C', 'E'), 'B'
-        assert graph.get_adjacent_vertices('C') == ('D', ), 'C'
-        assert graph.get_adjacent_vertices('D') == ('F', ), 'D'
-        assert graph.get_adjacent_vertices('E') == (), 'E'
-        assert graph.get_adjacent_vertices('F') == ('E', ), 'F'
-
-    def test_proper_adjacent_vertices_are_returned_for_undirected_graph(self):
-        graph = self._create_graph(GraphType.UNDIRECTED)
-        graph.add_edge('A', 'B')
-        graph.add_edge('A', 'C')
-        graph.add_edge('B', 'C')
-        graph.add_edge('B', 'E')
-        graph.add_edge('C', 'D')
-        graph.add_edge('D', 'F')
-        graph.add_edge('F', 'E')
-
-        assert graph.get_adjacent_vertices('A') == ('B', 'C'), 'A'
-        assert graph.get_adjacent_vertices('B') == ('A', 'C', 'E'), 'B'
-        assert graph.get_adjacent_vertices('C') == ('A', 'B', 'D'), 'C'
-        assert graph.get_adjacent_vertices('D') == ('C', 'F'), 'D'
-        assert graph.get_adjacent_vertices('E') == ('B', 'F'), 'E'
-        assert graph.get_adjacent_vertices('F') == ('D', 'E'), 'F'
-
-    def test_get_outgoing_edges_for_existent_vertex_returns_proper_tuple_of_edges(self):
-        graph = self._create_graph(GraphType.DIRECTED)
-        graph.add_edge('A', 'B', 2)
-        graph.add_edge('A', 'C', 3)
-        graph.add_edge('B', 'C', 5)
-        graph.add_edge('C', 'D', 4)
+    def test_get_outgoing_edges_for_existent_vertex_returns_proper_tuple_of_edges(self, graph_factory):
+        graph = graph_factory(GraphType.DIRECTED)
+        graph.add_edges([
+            ('A', 'B', 2),
+            ('A', 'C', 3),
+            ('B', 'C', 5),
+            ('C', 'D', 4),
+        ])
 
         assert graph.get_outgoing_edges('D') == ()
         assert graph.get_outgoing_edges('B') == (
@@ -255,98 +228,165 @@ class AbstractGraphTestFixture(ABC):
             Edge(start='A', destination='C', weight=3),
         )
 
-    def test_attempt_to_get_outgoing_edges_for_non_existent_vertex_leads_to_error(self):
-        graph = self._create_graph(GraphType.DIRECTED)
-        graph.add_edge('A', 'B')
-        graph.add_edge('A', 'C')
-        graph.add_edge('B', 'C')
-        graph.add_edge('C', 'D')
+    def test_get_all_edges_for_directed_graph_returns_proper_tuple_of_edges(self, graph_factory):
+        graph = graph_factory(GraphType.DIRECTED)
+        graph.add_edges([
+            ('A', 'B', 3),
+            ('A', 'C', 2),
+            ('B', 'C', 5),
+            ('C', 'D', 7),
+        ])
 
-        with raises(ValueError, match='Vertex with the name X not found.'):
-            graph.get_outgoing_edges('X')
+        actual = set(graph.get_all_edges())
 
-    def test_attempt_to_get_edge_weight_for_non_existent_start_vertex_leads_to_error(self):
-        graph = self._create_graph(GraphType.DIRECTED)
-        graph.add_edge('A', 'B')
-        graph.add_edge('A', 'C')
-        graph.add_edge('B', 'C')
-        graph.add_edge('C', 'D')
+        assert {
+            Edge(start='A', destination='B', weight=3),
+            Edge(start='A', destination='C', weight=2),
+            Edge(start='B', destination='C', weight=5),
+            Edge(start='C', destination='D', weight=7),
+        } <= actual
+
+    def test_get_all_edges_for_undirected_graph_returns_proper_tuple_of_edges(self, graph_factory):
+        graph = graph_factory(GraphType.UNDIRECTED)
+        graph.add_edges([
+            ('A', 'B'),
+            ('A', 'C'),
+            ('B', 'C'),
+            ('C', 'D'),
+        ])
+
+        actual = set(graph.get_all_edges())
+
+        assert {
+            Edge(start='A', destination='B', weight=1),
+            Edge(start='B', destination='A', weight=1),
+            Edge(start='A', destination='C', weight=1),
+            Edge(start='C', destination='A', weight=1),
+            Edge(start='B', destination='C', weight=1),
+            Edge(start='C', destination='B', weight=1),
+            Edge(start='C', destination='D', weight=1),
+            Edge(start='D', destination='C', weight=1),
+        } <= actual
+
+    def test_get_all_edges_for_empty_graph_returns_empty_tuple(self, graph_factory):
+        graph = graph_factory(GraphType.UNDIRECTED)
 
-        with raises(ValueError, match='Vertex with the name X not found.'):
-            graph.get_edge_weight('X', 'B')
+        assert graph.get_all_edges() == tuple()
 
-    def test_attempt_to_get_edge_weight_for_non_existent_destination_vertex_leads_to_error(self):
-        graph = self._create_graph(GraphType.DIRECTED)
-        graph.add_edge('A', 'B')
-        graph.add_edge('A', 'C')
-        graph.add_edge('B', 'C')
-        graph.add_edge('C', 'D')
 
-        with raises(ValueError, match='Vertex with the name X not found.'):
-            graph.get_edge_weight('B', 'X')
+class TestAdjacencyMatrixGraph:
+    """Collection of test methods exercising the functionality specific to the
+    :class: graphlib.graph.AdjacencyMatrixGraph, i.e. the limited capacity of
+    the adjacency matrix.
+    """
 
-    def test_attempt_to_get_edge_weight_for_non_existent_edge_leads_to_error(self):
-        graph = self._create_graph(GraphType.DIRECTED)
+    def test_attempt_to_exceed_capacity_leads_to_error_and_leaves_graph_unchanged(self):
+        graph = AdjacencyMatrixGraph(2, GraphType.DIRECTED)
         graph.add_edge('A', 'B')
-        graph.add_edge('A', 'C')
-        graph.add_edge('B', 'C')
-        graph.add_edge('C', 'D')
 
-        with raises(ValueError, match='There is no edge from B to A.'):
-            graph.get_edge_weight('B', 'A')
+        with raises(ValueError, match=_CAPACITY_EXCEEDED_RE):
+            graph.add_edge('C', 'D')
 
-    def test_get_all_edges_for_directed_graph_returns_proper_tuple_of_edges(self):
-        graph = self._create_graph(GraphType.DIRECTED)
-        graph.add_edge('A', 'B', 3)
-        graph.add_edge('A', 'C', 2)
-        graph.add_edge('B', 'C', 5)
-        graph.add_edge('C', 'D', 7)
+        assert graph.vertex_count == 2
+        assert graph.get_all_vertices(sort=True) == ('A', 'B')
 
-        all_edges = graph.get_all_edges()
 
-        assert Edge(start='A', destination='B', weight=3) in all_edges
-        assert Edge(start='A', destination='C', weight=2) in all_edges
-        assert Edge(start='B', destination='C', weight=5) in all_edges
-        assert Edge(start='C', destination='D', weight=7) in all_edges
+class TestGraphReadOnly:
+    """Collection of test methods common to all graph implementations (i.e. the
+    :class: graphlib.graph.AdjacencySetGraph and the :class:
+    graphlib.graph.AdjacencyMatrixGraph) that do not modify a graph once it has
+    been created.
 
-    def test_get_all_edges_for_undirected_graph_returns_proper_tuple_of_edges(self):
-        graph = self._create_graph(GraphType.UNDIRECTED)
-        graph.add_edge('A', 'B')
-        graph.add_edge('A', 'C')
-        graph.add_edge('B', 'C')
-        graph.add_edge('C', 'D')
-
-        all_edges = graph.get_all_edges()
-
-        for vertex_one, vertex_two in ('A', 'B'), ('A', 'C'), ('B', 'C'), ('C', 'D'):
-            assert Edge(start=vertex_one, destination=vertex_two, weight=1) in all_edges
-            assert Edge(start=vertex_two, destination=vertex_one, weight=1) in all_edges
-
-    def test_get_all_edges_for_empty_graph_returns_empty_tuple(self):
-        graph = self._create_graph(GraphType.UNDIRECTED)
+    The test methods use the graph_factory fixture (see conftest.py) to create
+    the graphs, so each test method is executed once per graph implementation.
+    The canonical graphs are shared by all test methods of the class.
+    """
 
-        assert graph.get_all_edges() == tuple()
+    @fixture(scope='class')
+    def canonical_directed_graph(self, graph_factory) -> AbstractGraph:
+        return _create_canonical_graph(graph_factory, GraphType.DIRECTED, weighted=False)
+
+    @fixture(scope='class')
+    def canonical_undirected_graph(self, graph_factory) -> AbstractGraph:
+        return _create_canonical_graph(graph_factory, GraphType.UNDIRECTED, weighted=False)
+
+    @fixture(scope='class')
+    def canonical_weighted_directed_graph(self, graph_factory) -> AbstractGraph:
+        return _create_canonical_graph(graph_factory, GraphType.DIRECTED, weighted=True)
+
+    @fixture(scope='class')
+    def canonical_weighted_undirected_graph(self, graph_factory) -> AbstractGraph:
+        return _create_canonical_graph(graph_factory, GraphType.UNDIRECTED, weighted=True)
+
+    @mark.parametrize('vertex, expected_in_degree', [
+        ('A', 0),
+        ('B', 1),
+        ('C', 2),
+        ('D', 1),
+        ('E', 2),
+        ('F', 1),
+    ])
+    def test_proper_in_degree_is_returned(self, canonical_directed_graph, vertex, expected_in_degree):
+        assert canonical_directed_graph.get_in_degree(vertex) == expected_in_degree
+
+    @mark.parametrize('start, destination, expected_weight', _CANONICAL_EDGES)
+    def test_proper_edge_weights_are_returned_for_directed_graph(self, canonical_weighted_directed_graph,
+                                                                 start, destination, expected_weight):
+        assert canonical_weighted_directed_graph.get_edge_weight(start, destination) == expected_weight
+
+    @mark.parametrize('vertex_one, vertex_two, expected_weight', _CANONICAL_EDGES)
+    def test_proper_edge_weights_for_both_directions_are_returned_for_undirected_graph(self, canonical_weighted_undirected_graph,
+                                                                                      vertex_one, vertex_two, expected_weight):
+        graph = canonical_weighted_undirected_graph
+
+        assert graph.get_edge_weight(vertex_one, vertex_two) == graph.get_edge_weight(vertex_two, vertex_one) == expected_weight
+
+    # be aware of the fact that this test case also covers vertices that are
+    # only the destination of an edge (they are not the start of any edge)
+    @mark.parametrize('vertex, expected_adjacent_vertices', [
+        ('A', ('B', 'C')),
+        ('B', ('C', 'E')),
+        ('C', ('D', )),
+        ('D', ('F', )),
+        ('E', ()),
+        ('F', ('E', )),
+    ])
+    def test_proper_adjacent_vertices_are_returned_for_directed_graph(self, canonical_directed_graph,
+                                                                      vertex, expected_adjacent_vertices):
+        assert canonical_directed_graph.get_adjacent_vertices(vertex) == expected_adjacent_vertices
+
+    @mark.parametrize('vertex, expected_adjacent_vertices', [
+        ('A', ('B', 'C')),
+        ('B', ('A', 'C', 'E')),
+        ('C', ('A', 'B', 'D')),
+        ('D', ('C', 'F')),
+        ('E', ('B', 'F')),
+        ('F', ('D', 'E')),
+    ])
+    def test_proper_adjacent_vertices_are_returned_for_undirected_graph(self, canonical_undirected_graph,
+                                                                        vertex, expected_adjacent_vertices):
+        assert canonical_undirected_graph.get_adjacent_vertices(vertex) == expected_adjacent_vertices
+
+    def test_attempt_to_get_outgoing_edges_for_non_existent_vertex_leads_to_error(self, canonical_directed_graph):
+        graph = canonical_directed_graph
+
+        with raises(ValueError, match=_VERTEX_NOT_FOUND_RE):
+            graph.get_outgoing_edges('X')
 
+    def test_attempt_to_get_edge_weight_for_non_existent_start_vertex_leads_to_error(self, canonical_directed_graph):
+        graph = canonical_directed_graph
 
-class TestAdjacencySetGraph(AbstractGraphTestFixture):
-    """Concrete test-fixture for the adjacency set implementation of graph
-    (i.e. for the class :class: graph.AdjacencySetGraph).
-    """
+        with raises(ValueError, match=_VERTEX_NOT_FOUND_RE):
+            graph.get_edge_weight('X', 'B')
 
-    def _create_graph(self, graph_type: GraphType) -> AbstractGraph:
-        """Creates and returns a new instance of the class :class:
-        graph.AdjacencySetGraph, representing the given graph type.
-        """
-        return AdjacencySetGraph(graph_type)
+    def test_attempt_to_get_edge_weight_for_non_existent_destination_vertex_leads_to_error(self, canonical_directed_graph):
+        graph = canonical_directed_graph
 
+        with raises(ValueError, match=_VERTEX_NOT_FOUND_RE):
+            graph.get_edge_weight('B', 'X')
 
-class TestAdjacencyMatrixGraph(AbstractGraphTestFixture):
-    """Concrete test-fixture for the adjacency matric implementation of graph
-    (i.e. for the :class: graphlib.graph.AdjacencyMatrixGraph).
-    """
+    def test_attempt_to_get_edge_weight_for_non_existent_edge_leads_to_error(self, canonical_directed_graph):
+        graph = canonical_directed_graph
 
-    def _create_graph(self, graph_type: GraphType) -> AbstractGraph:
-        """Creates and returns a new instance of the class :class:
-        graphlib.graph.AdjacencyMatrixGraph, representing the given graph type.
-        """
-        return AdjacencyMatrixGraph(20, graph_type)
+        with raises(ValueError, match=_NO_EDGE_FROM_B_TO_A_RE):
+            graph.get_edge_weight('B', 'A')
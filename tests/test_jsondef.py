@@ -20,190 +20,189 @@
 """Unit tests for the graphlib.jsondef module.
 """
 
-from abc import ABC, abstractproperty
-from typing import Callable, Type
+from io import BytesIO, StringIO
+import re
 
-from pytest import raises
+from pytest import mark, param, raises
 
 from graphlib.graph import AdjacencyMatrixGraph, AdjacencySetGraph, GraphType
+from graphlib.jsondef import build_adjacency_matrix_graph_from_dict, build_adjacency_matrix_graph_from_json_file
+from graphlib.jsondef import build_adjacency_matrix_graph_from_json_stream
 from graphlib.jsondef import build_adjacency_matrix_graph_from_json_string
-from graphlib.jsondef import build_adjacency_set_graph_from_json_string
+from graphlib.jsondef import build_adjacency_set_graph_from_dict, build_adjacency_set_graph_from_json_file
+from graphlib.jsondef import build_adjacency_set_graph_from_json_stream, build_adjacency_set_graph_from_json_string
 
 # pylint: disable=C0116
 
+_UNDEFINED_GRAPH_TYPE_RE = re.compile(r'Undefined graph type\.')
 
-class AbstractGraphBuildingTestFixture(ABC):
-    """Abstract test-fixture class that implements test methods common to methods
-    building a graph according to JSON definition.
+_INVALID_GRAPH_TYPE_RE = re.compile(r'Invalid graph type: DUMB\.')
 
-    This class is supposed to be used as base class for test fixtures for specific
-    graph-building methods, i.e.:
-    * :method: graphlib.jsondef.build_adjacency_matrix_graph_from_json_string
-    * :method: graphlib.jsondef.build_adjacency_set_graph_from_json_string
-    """
+_MISSING_EDGE_LIST_RE = re.compile(r'Missing edge list\.')
 
-    @abstractproperty
-    def _tested_function(self) -> Callable:
-        raise NotImplementedError
+_EMPTY_EDGE_LIST_RE = re.compile(r'Empty edge list\.')
 
-    @abstractproperty
-    def _expected_graph_class(self) -> Type:
-        raise NotImplementedError
+_UNDEFINED_START_VERTEX_RE = re.compile(r'Edge with undefined start vertex\.')
 
-    def test_directed_weighted_graph_is_built_properly_from_valid_definition(self):
-        json_string = """
-{
-    "graphType": "DIRECTED",
-    "edges": [
-        {
-            "start": "A",
-            "destination": "B",
-            "weight": 3
-        }, {
-            "start": "A",
-            "destination": "C",
-            "weight": 5
-        }, {
-            "start": "B",
-            "destination": "D",
-            "weight": 4
-        }, {
-            "start": "C",
-            "destination": "D",
-            "weight": 2
-        }, {
-            "start": "D",
-            "destination": "E",
-            "weight": 6
-        }
-    ]
-}
-"""
-        graph = self._tested_function(json_string)
+_UNDEFINED_DESTINATION_VERTEX_RE = re.compile(r'Edge with undefined destination vertex\.')
 
-        assert isinstance(graph, self._expected_graph_class)
-        assert graph.graph_type == GraphType.DIRECTED
-        assert graph.get_edge_weight('A', 'B') == 3
-        assert graph.get_edge_weight('A', 'C') == 5
-        assert graph.get_edge_weight('B', 'D') == 4
-        assert graph.get_edge_weight('C', 'D') == 2
-        assert graph.get_edge_weight('D', 'E') == 6
+_INVALID_WEIGHT_X_RE = re.compile(r'Invalid weight: X\.')
 
-        for start, destination in ('B', 'A'), ('C', 'A'), ('D', 'B'), ('D', 'C'), ('E', 'D'):
-            with raises(ValueError):
-                graph.get_edge_weight(start, destination)
+_INVALID_WEIGHT_MINUS_ONE_RE = re.compile(r'Invalid weight: -1\.')
 
-    def test_undirected_weighted_graph_is_built_properly_from_valid_definition(self):
-        json_string = """
-{
-    "graphType": "UNDIRECTED",
-    "edges": [
-        {
-            "start": "A",
-            "destination": "B",
-            "weight": 3
-        }, {
-            "start": "A",
-            "destination": "C",
-            "weight": 5
-        }, {
-            "start": "B",
-            "destination": "D",
-            "weight": 4
-        }, {
-            "start": "C",
-            "destination": "D",
-            "weight": 2
-        }, {
-            "start": "D",
-            "destination": "E",
-            "weight": 6
-        }
-    ]
-}
-"""
-        graph = self._tested_function(json_string)
+_INVALID_WEIGHT_ZERO_RE = re.compile(r'Invalid weight: 0\.')
 
-        assert isinstance(graph, self._expected_graph_class)
-        assert graph.graph_type == GraphType.UNDIRECTED
-        assert graph.get_edge_weight('A', 'B') == 3
-        assert graph.get_edge_weight('B', 'A') == 3
-        assert graph.get_edge_weight('A', 'C') == 5
-        assert graph.get_edge_weight('C', 'A') == 5
-        assert graph.get_edge_weight('B', 'D') == 4
-        assert graph.get_edge_weight('D', 'B') == 4
-        assert graph.get_edge_weight('C', 'D') == 2
-        assert graph.get_edge_weight('D', 'C') == 2
-        assert graph.get_edge_weight('D', 'E') == 6
-        assert graph.get_edge_weight('E', 'D') == 6
 
-    def test_directed_unweighted_graph_is_parsed_properly_from_valid_definition(self):
-        json_string = """
-{
-    "graphType": "DIRECTED",
-    "edges": [
-        {
-            "start": "A",
-            "destination": "B"
-        }, {
-            "start": "A",
-            "destination": "C"
-        }, {
-            "start": "B",
-            "destination": "D"
-        }, {
-            "start": "C",
-            "destination": "D"
-        }, {
-            "start": "D",
-            "destination": "E"
-        }
-    ]
-}
-"""
-        graph = self._tested_function(json_string)
+# builders of graphs from parsed JSON definitions, with the class of the graphs
+# they build
+_DICT_BUILDERS = [
+    param(build_adjacency_set_graph_from_dict, AdjacencySetGraph, id='set'),
+    param(build_adjacency_matrix_graph_from_dict, AdjacencyMatrixGraph, id='matrix'),
+]
 
-        assert isinstance(graph, self._expected_graph_class)
-        assert graph.graph_type == GraphType.DIRECTED
-        for start, destination in ('A', 'B'), ('A', 'C'), ('B', 'D'), ('C', 'D'), ('D', 'E'):
-            assert graph.get_edge_weight(start, destination) == 1
-            with raises(ValueError):
-                graph.get_edge_weight(destination, start)
+# builders of graphs from JSON strings
+_STRING_BUILDERS = [
+    param(build_adjacency_set_graph_from_json_string, id='set'),
+    param(build_adjacency_matrix_graph_from_json_string, id='matrix'),
+]
+
+# builders of graphs from JSON files, with the corresponding dict builder and
+# the class of the graphs they build
+_FILE_BUILDERS = [
+    param(build_adjacency_set_graph_from_json_file, build_adjacency_set_graph_from_dict, AdjacencySetGraph, id='set'),
+    param(build_adjacency_matrix_graph_from_json_file, build_adjacency_matrix_graph_from_dict, AdjacencyMatrixGraph,
+          id='matrix'),
+]
 
-    def test_undirected_unweighted_graph_is_parsed_properly_from_valid_definition(self):
-        json_string = """
-{
-    "graphType": "UNDIRECTED",
-    "edges": [
-        {
-            "start": "A",
-            "destination": "B"
-        }, {
-            "start": "A",
-            "destination": "C"
-        }, {
-            "start": "B",
-            "destination": "D"
-        }, {
-            "start": "C",
-            "destination": "D"
-        }, {
-            "start": "D",
-            "destination": "E"
-        }
-    ]
-}
-"""
-        graph = self._tested_function(json_string)
+# builders of graphs from JSON streams, with the corresponding dict builder and
+# the class of the graphs they build
+_STREAM_BUILDERS = [
+    param(build_adjacency_set_graph_from_json_stream, build_adjacency_set_graph_from_dict, AdjacencySetGraph, id='set'),
+    param(build_adjacency_matrix_graph_from_json_stream, build_adjacency_matrix_graph_from_dict, AdjacencyMatrixGraph,
+          id='matrix'),
+]
+
+
+@mark.parametrize('builder, expected_class', _DICT_BUILDERS)
+def test_directed_weighted_graph_is_built_properly_from_valid_definition(builder, expected_class,
+                                                                         directed_weighted_definition):
+    graph = builder(directed_weighted_definition)
+
+    assert isinstance(graph, expected_class)
+    assert graph.graph_type == GraphType.DIRECTED
+    assert graph.get_edge_weight('A', 'B') == 3
+    assert graph.get_edge_weight('A', 'C') == 5
+    assert graph.get_edge_weight('B', 'D') == 4
+    assert graph.get_edge_weight('C', 'D') == 2
+    assert graph.get_edge_weight('D', 'E') == 6
 
-        assert isinstance(graph, self._expected_graph_class)
-        assert graph.graph_type == GraphType.UNDIRECTED
-        for vertex_one, vertex_two in ('A', 'B'), ('A', 'C'), ('B', 'D'), ('C', 'D'), ('D', 'E'):
-            assert graph.get_edge_weight(vertex_one, vertex_two) == 1
-            assert graph.get_edge_weight(vertex_two, vertex_one) == 1
+    for start, destination in ('B', 'A'), ('C', 'A'), ('D', 'B'), ('D', 'C'), ('E', 'D'):
+        with raises(ValueError):
+            graph.get_edge_weight(start, destination)
 
-    def test_json_definition_without_graph_type_leads_to_error(self):
-        json_data = """
+
+@mark.parametrize('builder, expected_class', _DICT_BUILDERS)
+def test_undirected_weighted_graph_is_built_properly_from_valid_definition(builder, expected_class,
+                                                                           undirected_weighted_definition):
+    graph = builder(undirected_weighted_definition)
+
+    assert isinstance(graph, expected_class)
+    assert graph.graph_type == GraphType.UNDIRECTED
+    assert graph.get_edge_weight('A', 'B') == 3
+    assert graph.get_edge_weight('B', 'A') == 3
+    assert graph.get_edge_weight('A', 'C') == 5
+    assert graph.get_edge_weight('C', 'A') == 5
+    assert graph.get_edge_weight('B', 'D') == 4
+    assert graph.get_edge_weight('D', 'B') == 4
+    assert graph.get_edge_weight('C', 'D') == 2
+    assert graph.get_edge_weight('D', 'C') == 2
+    assert graph.get_edge_weight('D', 'E') == 6
+    assert graph.get_edge_weight('E', 'D') == 6
+
+
+@mark.parametrize('builder, expected_class', _DICT_BUILDERS)
+def test_directed_unweighted_graph_is_parsed_properly_from_valid_definition(builder, expected_class,
+                                                                            directed_unweighted_definition):
+    graph = builder(directed_unweighted_definition)
+
+    assert isinstance(graph, expected_class)
+    assert graph.graph_type == GraphType.DIRECTED
+    for start, destination in ('A', 'B'), ('A', 'C'), ('B', 'D'), ('C', 'D'), ('D', 'E'):
+        assert graph.get_edge_weight(start, destination) == 1
+        with raises(ValueError):
+            graph.get_edge_weight(destination, start)
+
+
+@mark.parametrize('builder, expected_class', _DICT_BUILDERS)
+def test_undirected_unweighted_graph_is_parsed_properly_from_valid_definition(builder, expected_class,
+                                                                              undirected_unweighted_definition):
+    graph = builder(undirected_unweighted_definition)
+
+    assert isinstance(graph, expected_class)
+    assert graph.graph_type == GraphType.UNDIRECTED
+    for vertex_one, vertex_two in ('A', 'B'), ('A', 'C'), ('B', 'D'), ('C', 'D'), ('D', 'E'):
+        assert graph.get_edge_weight(vertex_one, vertex_two) == 1
+        assert graph.get_edge_weight(vertex_two, vertex_one) == 1
+
+
+@mark.parametrize('builder, dict_builder, expected_class', _FILE_BUILDERS)
+def test_graph_built_from_json_file_is_equal_to_graph_built_from_parsed_definition(
+        builder, dict_builder, expected_class, json_fixture_dir, directed_weighted_definition):
+    graph = builder(str(json_fixture_dir / 'directed_weighted.json'))
+    expected_graph = dict_builder(directed_weighted_definition)
+
+    assert isinstance(graph, expected_class)
+    assert graph.graph_type == expected_graph.graph_type
+    assert set(graph.get_all_edges()) == set(expected_graph.get_all_edges())
+
+
+@mark.parametrize('stream_class', [StringIO, BytesIO])
+@mark.parametrize('builder, dict_builder, expected_class', _STREAM_BUILDERS)
+def test_graph_built_from_json_stream_is_equal_to_graph_built_from_parsed_definition(
+        builder, dict_builder, expected_class, stream_class, json_fixture_dir, directed_weighted_definition):
+    content = (json_fixture_dir / 'directed_weighted.json').read_bytes()
+    if stream_class is StringIO:
+        content = content.decode('utf-8')
+    with stream_class(content) as stream:
+        graph = builder(stream)
+    expected_graph = dict_builder(directed_weighted_definition)
+
+    assert isinstance(graph, expected_class)
+    assert graph.graph_type == expected_graph.graph_type
+    assert set(graph.get_all_edges()) == set(expected_graph.get_all_edges())
+
+
+@mark.parametrize('builder', _STRING_BUILDERS)
+def test_repeated_build_from_the_same_json_string_returns_independent_graphs(builder, json_fixture_dir):
+    json_string = (json_fixture_dir / 'directed_weighted.json').read_text()
+    graph_one = builder(json_string)
+    graph_two = builder(json_string)
+
+    graph_one.add_edge('E', 'F', 7)
+
+    assert graph_one is not graph_two
+    assert graph_one.get_edge_weight('E', 'F') == 7
+    assert graph_two.vertex_count == 5
+    with raises(ValueError):
+        graph_two.get_edge_weight('E', 'F')
+
+
+@mark.parametrize('string_class', [str, bytes, bytearray])
+@mark.parametrize('builder', _STRING_BUILDERS)
+def test_graph_is_repeatedly_built_from_json_string_of_any_string_class(builder, string_class, json_fixture_dir):
+    content = (json_fixture_dir / 'directed_weighted.json').read_bytes()
+    json_string = content.decode('utf-8') if string_class is str else string_class(content)
+
+    for _ in range(2):
+        graph = builder(json_string)
+
+        assert graph.get_edge_weight('A', 'B') == 3
+        assert graph.get_edge_weight('D', 'E') == 6
+
+
+@mark.parametrize('builder', _STRING_BUILDERS)
+def test_json_definition_without_graph_type_leads_to_error(builder):
+    json_data = """
 {
     "edges": [
         {
@@ -219,11 +218,13 @@ class AbstractGraphBuildingTestFixture(ABC):
 }
 """
 
-        with raises(ValueError, match='Undefined graph type.'):
-            self._tested_function(json_data)
+    with raises(ValueError, match=_UNDEFINED_GRAPH_TYPE_RE):
+        builder(json_data)
+
 
-    def test_json_definition_with_invalid_graph_type_leads_to_error(self):
-        json_data = """
+@mark.parametrize('builder', _STRING_BUILDERS)
+def test_json_definition_with_invalid_graph_type_leads_to_error(builder):
+    json_data = """
 {
     "graphType": "DUMB",
     "edges": [
@@ -240,32 +241,38 @@ class AbstractGraphBuildingTestFixture(ABC):
 }
 """
 
-        with raises(ValueError, match='Invalid graph type: DUMB.'):
-            self._tested_function(json_data)
+    with raises(ValueError, match=_INVALID_GRAPH_TYPE_RE):
+        builder(json_data)
+
 
-    def test_json_definition_without_edge_list_leads_to_error(self):
-        json_data = """
+@mark.parametrize('builder', _STRING_BUILDERS)
+def test_json_definition_without_edge_list_leads_to_error(builder):
+    json_data = """
 {
     "graphType": "DIRECTED"
 }
 """
 
-        with raises(ValueError, match='Missing edge list.'):
-            self._tested_function(json_data)
+    with raises(ValueError, match=_MISSING_EDGE_LIST_RE):
+        builder(json_data)
 
-    def test_json_definition_with_empty_edge_list_leads_to_error(self):
-        json_data = """
+
+@mark.parametrize('builder', _STRING_BUILDERS)
+def test_json_definition_with_empty_edge_list_leads_to_error(builder):
+    json_data = """
 {
     "graphType": "DIRECTED",
     "edges": []
 }
 """
 
-        with raises(ValueError, match='Empty edge list.'):
-            self._tested_function(json_data)
+    with raises(ValueError, match=_EMPTY_EDGE_LIST_RE):
+        builder(json_data)
+
 
-    def test_json_definition_with_missing_start_vertex_leads_to_error(self):
-        json_data = """
+@mark.parametrize('builder', _STRING_BUILDERS)
+def test_json_definition_with_missing_start_vertex_leads_to_error(builder):
+    json_data = """
 {
     "graphType": "DIRECTED",
     "edges": [
@@ -281,11 +288,13 @@ class AbstractGraphBuildingTestFixture(ABC):
 }
 """
 
-        with raises(ValueError, match='Edge with undefined start vertex.'):
-            self._tested_function(json_data)
+    with raises(ValueError, match=_UNDEFINED_START_VERTEX_RE):
+        builder(json_data)
+
 
-    def test_json_definition_with_missing_destination_vertex_leads_to_error(self):
-        json_data = """
+@mark.parametrize('builder', _STRING_BUILDERS)
+def test_json_definition_with_missing_destination_vertex_leads_to_error(builder):
+    json_data = """
 {
     "graphType": "DIRECTED",
     "edges": [
@@ -301,11 +310,13 @@ class AbstractGraphBuildingTestFixture(ABC):
 }
 """
 
-        with raises(ValueError, match='Edge with undefined destination vertex.'):
-            self._tested_function(json_data)
+    with raises(ValueError, match=_UNDEFINED_DESTINATION_VERTEX_RE):
+        builder(json_data)
 
-    def test_json_definition_with_invalid_edge_weight_leads_to_error(self):
-        json_data = """
+
+@mark.parametrize('builder', _STRING_BUILDERS)
+def test_json_definition_with_invalid_edge_weight_leads_to_error(builder):
+    json_data = """
 {
     "graphType": "DIRECTED",
     "edges": [
@@ -318,11 +329,13 @@ class AbstractGraphBuildingTestFixture(ABC):
 }
 """
 
-        with raises(ValueError, match='Invalid weight: X.'):
-            self._tested_function(json_data)
+    with raises(ValueError, match=_INVALID_WEIGHT_X_RE):
+        builder(json_data)
+
 
-    def test_json_definition_with_negative_edge_weight_leads_to_error(self):
-        json_data = """
+@mark.parametrize('builder', _STRING_BUILDERS)
+def test_json_definition_with_negative_edge_weight_leads_to_error(builder):
+    json_data = """
 {
     "graphType": "DIRECTED",
     "edges": [
@@ -335,11 +348,13 @@ class AbstractGraphBuildingTestFixture(ABC):
 }
 """
 
-        with raises(ValueError, match='Invalid weight: -1.'):
-            self._tested_function(json_data)
+    with raises(ValueError, match=_INVALID_WEIGHT_MINUS_ONE_RE):
+        builder(json_data)
+
 
-    def test_json_definition_with_edge_weight_equal_to_zero_leads_to_error(self):
-        json_data = """
+@mark.parametrize('builder', _STRING_BUILDERS)
+def test_json_definition_with_edge_weight_equal_to_zero_leads_to_error(builder):
+    json_data = """
 {
     "graphType": "DIRECTED",
     "edges": [
@@ -352,33 +367,28 @@ class AbstractGraphBuildingTestFixture(ABC):
 }
 """
 
-        with raises(ValueError, match='Invalid weight: 0.'):
-            self._tested_function(json_data)
-
-
-class TestAdjacencySetGraphBuilding(AbstractGraphBuildingTestFixture):
-    """Concrete test-fixture for the method :method:
-    graphlib.jsondef.build_adjacency_set_graph_from_json_string.
-    """
-
-    @property
-    def _tested_function(self) -> Callable:
-        return build_adjacency_set_graph_from_json_string
+    with raises(ValueError, match=_INVALID_WEIGHT_ZERO_RE):
+        builder(json_data)
 
-    @property
-    def _expected_graph_class(self) -> Type:
-        return AdjacencySetGraph
 
+@mark.parametrize('raw_weight, expected_weight', [(7, 7), ('7', 7), (' 12 ', 12), ('+5', 5), ('1_000', 1000), (3.0, 3)])
+@mark.parametrize('builder, expected_class', _DICT_BUILDERS)
+def test_supported_representations_of_edge_weight_are_accepted(builder, expected_class, raw_weight, expected_weight):
+    graph = builder({
+        'graphType': 'DIRECTED',
+        'edges': [{'start': 'A', 'destination': 'B', 'weight': raw_weight}]
+    })
 
-class TestAdjacencyMatrixGraphBuilding(AbstractGraphBuildingTestFixture):
-    """Concrete test-fixture for the method :method:
-    graphlib.jsondef.build_adjacency_matrix_graph_from_json_string.
-    """
+    assert isinstance(graph, expected_class)
+    assert graph.get_edge_weight('A', 'B') == expected_weight
 
-    @property
-    def _tested_function(self) -> Callable:
-        return build_adjacency_matrix_graph_from_json_string
 
-    @property
-    def _expected_graph_class(self) -> Type:
-        return AdjacencyMatrixGraph
+@mark.parametrize('raw_weight', ['-3', '2.5', '', '1__0', '_1', 2.5, True, False, None, [1]])
+@mark.parametrize('builder, expected_class', _DICT_BUILDERS)
+def test_unsupported_representations_of_edge_weight_lead_to_error(
+        builder, expected_class, raw_weight): # pylint: disable=W0613
+    with raises(ValueError, match=re.compile(re.escape(f'Invalid weight: {raw_weight}.'))):
+        builder({
+            'graphType': 'DIRECTED',
+            'edges': [{'start': 'A', 'destination': 'B', 'weight': raw_weight}]
+        })
@@ -20,155 +20,220 @@
 """Unit tests for the graphlib.util module.
 """
 
-from pytest import raises
+import re
+from random import Random
+from typing import Tuple
+
+from pytest import mark, param, raises
 
 from graphlib.util import QueueableItem, RepriorizablePriorityQueue, SimplePriorityQueue
 from graphlib.util import UnionFind
 
+_EMPTY_QUEUE_ERROR_RE = re.compile(r'Cannot dequeue from empty queue\.')
 
-class TestSimplePriorityQueue: # pylint: disable=R0201,C0116,C0121
-    """Collection of test methods exercising the class :class:
-    graphlib.util.SimplePriorityQueue.
-    """
 
-    def test_virgin_priority_queue_is_empty(self):
-        queue = SimplePriorityQueue()
-        assert queue.is_not_empty() == False
+def _raises_empty_queue_error():
+    return raises(IndexError, match=_EMPTY_QUEUE_ERROR_RE)
 
-    def test_priority_queue_with_elements_is_not_empty(self):
-        queue = SimplePriorityQueue()
 
-        queue.enqueue(priority=4, item='D')
-        assert queue.is_not_empty()
+def _enqueue_to_simple_queue(queue: SimplePriorityQueue, priority: int, item: str):
+    queue.enqueue(priority=priority, item=item)
 
-        queue.enqueue(priority=5, item='A')
-        assert queue.is_not_empty()
 
-        queue.enqueue(priority=3, item='B', )
-        assert queue.is_not_empty()
+def _dequeue_from_simple_queue(queue: SimplePriorityQueue) -> str:
+    return queue.dequeue()
 
-        queue.dequeue()
-        assert queue.is_not_empty()
 
-        queue.dequeue()
-        assert queue.is_not_empty()
+def _enqueue_to_repriorizable_queue(queue: RepriorizablePriorityQueue, priority: int, item: str):
+    queue.enqueue(QueueableItem(item, priority))
 
-    def test_priority_queue_after_removal_of_last_element_is_empty(self):
-        queue = SimplePriorityQueue()
 
-        queue.enqueue(priority=5, item='A')
-        queue.enqueue(priority=3, item='B')
-        queue.dequeue()
-        queue.enqueue(priority=4, item='C')
-        queue.dequeue()
-        queue.dequeue()
-        assert queue.is_not_empty() == False
+def _dequeue_from_repriorizable_queue(queue: RepriorizablePriorityQueue) -> str:
+    return queue.dequeue().key
 
-        queue.enqueue(priority=2, item='D')
-        queue.dequeue()
-        assert queue.is_not_empty() == False
 
-        queue.enqueue(priority=3, item='E')
-        queue.enqueue(priority=1, item='F')
-        queue.dequeue()
-        queue.dequeue()
-        assert queue.is_not_empty() == False
+def _dequeue_key_and_priority(queue: RepriorizablePriorityQueue) -> Tuple[str, int]:
+    item = queue.dequeue()
+    return item.key, item.priority
 
-    def test_dequeing_from_priority_queue_reflects_priority(self):
-        queue = SimplePriorityQueue()
-        queue.enqueue(priority=4, item='D')
-        queue.enqueue(priority=5, item='A')
-        queue.enqueue(priority=3, item='B')
-        queue.enqueue(priority=7, item='C')
 
-        assert queue.dequeue() == 'B'
-        assert queue.dequeue() == 'D'
+# priority queue implementations, with adapters unifying their enqueue/dequeue API
+_QUEUE_IMPLEMENTATIONS = [
+    param(SimplePriorityQueue, _enqueue_to_simple_queue, _dequeue_from_simple_queue, id='simple'),
+    param(RepriorizablePriorityQueue, _enqueue_to_repriorizable_queue, _dequeue_from_repriorizable_queue,
+          id='repriorizable'),
+]
 
-        queue.enqueue(priority=1, item='E')
 
-        assert queue.dequeue() == 'E'
-        assert queue.dequeue() == 'A'
-        assert queue.dequeue() == 'C'
+# the number of rounds executed by each of the benchmarks
+_BENCHMARK_ROUNDS = 20
 
-    def test_attempt_to_deque_from_virgin_queue_leads_to_error(self):
-        queue = SimplePriorityQueue()
-        with raises(IndexError, match=r'Cannot dequeue from empty queue\.'):
-            queue.dequeue()
-
-    def test_attempt_to_deque_from_empty_queue_leads_to_error(self):
-        queue = SimplePriorityQueue()
-        queue.enqueue(priority=5, item='A')
-        queue.enqueue(priority=4, item='B')
-        queue.dequeue()
-        queue.dequeue()
-
-        with raises(IndexError, match=r'Cannot dequeue from empty queue\.'):
-            queue.dequeue()
+# (priority, item) pairs enqueued by the benchmarks; the priorities are random,
+# but the seed is fixed, so all benchmarks always use the same workload
+_BENCHMARK_WORKLOAD = tuple((priority, f'item-{index}') for index, priority in
+                            enumerate(Random(20201231).choices(range(1000), k=10_000)))
 
 
-class TestRepriorizablePriorityQueue: # pylint: disable=R0201,C0116,C0121
-    """Collection of test methods exercising the class :class:
+@mark.parametrize('queue_class, enqueue, dequeue', _QUEUE_IMPLEMENTATIONS)
+class TestPriorityQueueContract: # pylint: disable=R0201,C0116,C0121
+    """Collection of test methods exercising the functionality common to the
+    classes :class: graphlib.util.SimplePriorityQueue and :class:
     graphlib.util.RepriorizablePriorityQueue.
     """
 
-    def test_virgin_priority_queue_is_empty(self):
-        queue = RepriorizablePriorityQueue()
+    def test_virgin_priority_queue_is_empty(self, queue_class, enqueue, dequeue): # pylint: disable=W0613
+        queue = queue_class()
         assert queue.is_not_empty() == False
 
-    def test_priority_queue_with_elements_is_not_empty(self):
-        queue = RepriorizablePriorityQueue()
+    @staticmethod
+    def _execute_script(queue, enqueue, dequeue, script):
+        # each step of the script is a tuple (operation, argument, expected
+        # result of is_not_empty after the operation), where the argument is
+        # a (priority, item) tuple for enqueue and None for dequeue; the
+        # observed results are collected and verified by a single assertion
+        observed_not_empty = []
+        for operation, argument, _ in script:
+            if operation == 'enqueue':
+                enqueue(queue, *argument)
+            else:
+                dequeue(queue)
+            observed_not_empty.append(queue.is_not_empty())
+        assert observed_not_empty == [expected_not_empty for _, _, expected_not_empty in script]
+
+    def test_priority_queue_with_elements_is_not_empty(self, queue_class, enqueue, dequeue):
+        self._execute_script(queue_class(), enqueue, dequeue, [
+            ('enqueue', (4, 'D'), True),
+            ('enqueue', (5, 'A'), True),
+            ('enqueue', (3, 'B'), True),
+            ('dequeue', None, True),
+            ('dequeue', None, True),
+        ])
+
+    def test_priority_queue_after_removal_of_last_element_is_empty(self, queue_class, enqueue, dequeue):
+        self._execute_script(queue_class(), enqueue, dequeue, [
+            ('enqueue', (5, 'A'), True),
+            ('enqueue', (3, 'B'), True),
+            ('dequeue', None, True),
+            ('enqueue', (4, 'C'), True),
+            ('dequeue', None, True),
+            ('dequeue', None, False),
+            ('enqueue', (2, 'D'), True),
+            ('dequeue', None, False),
+            ('enqueue', (3, 'E'), True),
+            ('enqueue', (1, 'F'), True),
+            ('dequeue', None, True),
+            ('dequeue', None, False),
+        ])
+
+    def test_dequeing_from_priority_queue_reflects_priority(self, queue_class, enqueue, dequeue):
+        queue = queue_class()
+        enqueue(queue, 4, 'D')
+        enqueue(queue, 5, 'A')
+        enqueue(queue, 3, 'B')
+        enqueue(queue, 7, 'C')
+
+        assert dequeue(queue) == 'B'
+        assert dequeue(queue) == 'D'
+
+        enqueue(queue, 1, 'E')
+
+        assert dequeue(queue) == 'E'
+        assert dequeue(queue) == 'A'
+        assert dequeue(queue) == 'C'
+
+    def test_items_with_the_same_priority_are_dequeued_in_insertion_order(self, queue_class, enqueue, dequeue):
+        queue = queue_class()
+        enqueue(queue, 2, 'A')
+        enqueue(queue, 1, 'B')
+        enqueue(queue, 2, 'C')
+        enqueue(queue, 1, 'D')
+
+        assert dequeue(queue) == 'B'
+        assert dequeue(queue) == 'D'
+        assert dequeue(queue) == 'A'
+        assert dequeue(queue) == 'C'
+
+    def test_attempt_to_deque_from_virgin_queue_leads_to_error(self, queue_class, enqueue, dequeue): # pylint: disable=W0613
+        queue = queue_class()
+        with _raises_empty_queue_error():
+            dequeue(queue)
+
+    def test_attempt_to_deque_from_empty_queue_leads_to_error(self, queue_class, enqueue, dequeue):
+        queue = queue_class()
+        enqueue(queue, 5, 'A')
+        enqueue(queue, 4, 'B')
+        dequeue(queue)
+        dequeue(queue)
+
+        with _raises_empty_queue_error():
+            dequeue(queue)
+
+    @mark.benchmark(group='priority-queue-push')
+    def test_benchmark_push(self, benchmark, queue_class, enqueue, dequeue): # pylint: disable=W0613
+        def push_all():
+            queue = queue_class()
+            for priority, item in _BENCHMARK_WORKLOAD:
+                enqueue(queue, priority, item)
+
+        benchmark.pedantic(push_all, iterations=1, rounds=_BENCHMARK_ROUNDS)
+
+    @mark.benchmark(group='priority-queue-pop')
+    def test_benchmark_pop(self, benchmark, queue_class, enqueue, dequeue):
+        def create_full_queue():
+            queue = queue_class()
+            for priority, item in _BENCHMARK_WORKLOAD:
+                enqueue(queue, priority, item)
+            return (queue,), {}
+
+        def pop_all(queue):
+            while queue.is_not_empty():
+                dequeue(queue)
+
+        benchmark.pedantic(pop_all, setup=create_full_queue, rounds=_BENCHMARK_ROUNDS)
+
+    @mark.benchmark(group='priority-queue-mixed')
+    def test_benchmark_mixed_push_and_pop(self, benchmark, queue_class, enqueue, dequeue):
+        # four pushes followed by one pop
+        def push_and_pop():
+            queue = queue_class()
+            for index, (priority, item) in enumerate(_BENCHMARK_WORKLOAD):
+                enqueue(queue, priority, item)
+                if index % 4 == 3:
+                    dequeue(queue)
+
+        benchmark.pedantic(push_and_pop, iterations=1, rounds=_BENCHMARK_ROUNDS)
 
-        queue.enqueue(QueueableItem('D', 4))
-        assert queue.is_not_empty()
 
-        queue.enqueue(QueueableItem('A', 5))
-        assert queue.is_not_empty()
-
-        queue.enqueue(QueueableItem('B', 3))
-        assert queue.is_not_empty()
-
-        queue.dequeue()
-        assert queue.is_not_empty()
-
-        queue.dequeue()
-        assert queue.is_not_empty()
+class TestSimplePriorityQueue: # pylint: disable=R0201,C0116,C0121
+    """Collection of test methods exercising the functionality specific to the
+    class :class: graphlib.util.SimplePriorityQueue.
+    """
 
-    def test_priority_queue_after_removal_of_last_element_is_empty(self):
-        queue = RepriorizablePriorityQueue()
+    def test_items_not_supporting_ordering_can_be_enqueued(self):
+        queue = SimplePriorityQueue()
+        # dictionaries do not support ordering, so the queue must never compare the items
+        queue.enqueue(priority=2, item={'name': 'A'})
+        queue.enqueue(priority=1, item={'name': 'B'})
+        queue.enqueue(priority=2, item={'name': 'C'})
 
-        queue.enqueue(QueueableItem('A', 5))
-        queue.enqueue(QueueableItem('B', 3))
-        queue.dequeue()
-        queue.enqueue(QueueableItem('C', 4))
-        queue.dequeue()
-        queue.dequeue()
-        assert queue.is_not_empty() == False
+        assert queue.dequeue() == {'name': 'B'}
+        assert queue.dequeue() == {'name': 'A'}
+        assert queue.dequeue() == {'name': 'C'}
 
-        queue.enqueue(QueueableItem('D', 2))
-        queue.dequeue()
-        assert queue.is_not_empty() == False
 
-        queue.enqueue(QueueableItem('E', 3))
-        queue.enqueue(QueueableItem('F', 1))
-        queue.dequeue()
-        queue.dequeue()
-        assert queue.is_not_empty() == False
+class TestRepriorizablePriorityQueue: # pylint: disable=R0201,C0116,C0121
+    """Collection of test methods exercising the functionality specific to the
+    class :class: graphlib.util.RepriorizablePriorityQueue, i.e. modification
+    of the priority of the items present in the queue.
+    """
 
-    def test_dequeing_from_priority_queue_reflects_priority(self):
+    def test_dequeued_item_carries_key_and_priority(self):
         queue = RepriorizablePriorityQueue()
-        queue.enqueue(QueueableItem('D', 4))
-        queue.enqueue(QueueableItem('A', 5))
-        queue.enqueue(QueueableItem('B', 3))
-        queue.enqueue(QueueableItem('C', 7))
-
-        assert queue.dequeue() == QueueableItem('B', 3)
-        assert queue.dequeue() == QueueableItem('D', 4)
+        queue.enqueue(QueueableItem('A', 5, 'value of A'))
 
-        queue.enqueue(QueueableItem('E', 1))
+        item = queue.dequeue()
 
-        assert queue.dequeue() == QueueableItem('E', 1)
-        assert queue.dequeue() == QueueableItem('A', 5)
-        assert queue.dequeue() == QueueableItem('C', 7)
+        assert (item.key, item.priority, item.value) == ('A', 5, 'value of A')
 
     def test_dequeing_from_priority_queue_reflects_modification_of_priority(self):
         queue = RepriorizablePriorityQueue()
@@ -179,10 +244,25 @@ class TestRepriorizablePriorityQueue: # pylint: disable=R0201,C0116,C0121
         queue.enqueue(QueueableItem('D', 1))
         queue.enqueue(QueueableItem('C', 2))
 
-        assert queue.dequeue() == QueueableItem('D', 1)
-        assert queue.dequeue() == QueueableItem('C', 2)
-        assert queue.dequeue() == QueueableItem('B', 3)
-        assert queue.dequeue() == QueueableItem('A', 5)
+        assert _dequeue_key_and_priority(queue) == ('D', 1)
+        assert _dequeue_key_and_priority(queue) == ('C', 2)
+        assert _dequeue_key_and_priority(queue) == ('B', 3)
+        assert _dequeue_key_and_priority(queue) == ('A', 5)
+
+    def test_dequeing_from_priority_queue_with_several_heap_levels_reflects_modified_priorities(self):
+        queue = RepriorizablePriorityQueue()
+        # enough items to fill several levels of the heap, enqueued in scrambled order
+        for index in range(40):
+            queue.enqueue(QueueableItem(f'K{index}', (index * 17) % 40 + 100))
+        for index in range(0, 40, 3):
+            queue.enqueue(QueueableItem(f'K{index}', index))
+
+        dequeued_priorities = []
+        while queue.is_not_empty():
+            dequeued_priorities.append(queue.dequeue().priority)
+
+        assert len(dequeued_priorities) == 40
+        assert dequeued_priorities == sorted(dequeued_priorities)
 
     def test_items_with_modified_priority_are_counted_just_once(self):
         queue = RepriorizablePriorityQueue()
@@ -196,21 +276,6 @@ class TestRepriorizablePriorityQueue: # pylint: disable=R0201,C0116,C0121
 
         assert queue.is_not_empty() == False
 
-    def test_attempt_to_deque_from_virgin_queue_leads_to_error(self):
-        queue = RepriorizablePriorityQueue()
-        with raises(IndexError, match=r'Cannot dequeue from empty queue\.'):
-            queue.dequeue()
-
-    def test_attempt_to_deque_from_empty_queue_leads_to_error(self):
-        queue = RepriorizablePriorityQueue()
-        queue.enqueue(QueueableItem('A', 5))
-        queue.enqueue(QueueableItem('B', 4))
-        queue.dequeue()
-        queue.dequeue()
-
-        with raises(IndexError, match=r'Cannot dequeue from empty queue\.'):
-            queue.dequeue()
-
     def test_attempt_to_deque_from_empty_queue_after_reprioritization_leads_to_error(self):
         queue = RepriorizablePriorityQueue()
         queue.enqueue(QueueableItem('A', 7))
@@ -219,10 +284,21 @@ class TestRepriorizablePriorityQueue: # pylint: disable=R0201,C0116,C0121
         queue.enqueue(QueueableItem('A', 3))
         queue.dequeue()
 
-        with raises(IndexError, match=r'Cannot dequeue from empty queue\.'):
+        with _raises_empty_queue_error():
             queue.dequeue()
 
 
+# pairs of elements merged by the union-find instances created by _create_merged_union_find
+_MERGED_PAIRS = ((4, 6), (3, 7), (2, 6), (1, 8))
+
+
+def _create_merged_union_find() -> UnionFind:
+    union_find = UnionFind(10)
+    for element_one, element_two in _MERGED_PAIRS:
+        union_find.union(element_one, element_two)
+    return union_find
+
+
 class TestUnionFind: # pylint: disable=R0201,C0116,C0301,C0121
     """Collection of test methods exercising the class :class:
     graphlib.util.UnionFind.
@@ -282,13 +358,9 @@ class TestUnionFind: # pylint: disable=R0201,C0116,C0301,C0121
         assert union_find.union(1, 3) == False
 
     def test_union_of_elements_already_belonging_to_the_same_subset_does_not_change_the_subset_of_the_elements(self):
-        union_find = UnionFind(10)
-        union_find.union(4, 6)
-        union_find.union(3, 7)
-        union_find.union(2, 6)
-        union_find.union(1, 8)
+        union_find = _create_merged_union_find()
 
-        for element_one, element_two in (4, 6), (3, 7), (2, 6), (1, 8):
+        for element_one, element_two in _MERGED_PAIRS:
             original_subset_one = union_find.find_subset(element_one)
             original_subset_two = union_find.find_subset(element_two)
 
@@ -307,13 +379,9 @@ class TestUnionFind: # pylint: disable=R0201,C0116,C0301,C0121
         assert union_find.subset_count == subset_count_before
 
     def test_union_of_elements_already_belonging_to_the_same_subset_does_not_change_the_size_of_subsets(self):
-        union_find = UnionFind(10)
-        union_find.union(4, 6)
-        union_find.union(3, 7)
-        union_find.union(2, 6)
-        union_find.union(1, 8)
+        union_find = _create_merged_union_find()
 
-        for element_one, element_two in (4, 6), (3, 7), (2, 6), (1, 8):
+        for element_one, element_two in _MERGED_PAIRS:
             original_subset_one_size = union_find.subset_size(element_one)
             original_subset_two_size = union_find.subset_size(element_two)
 